@@ -0,0 +1,36 @@
+"""server_side_uuid_defaults
+
+Revision ID: 9c4e2f1a6b3d
+Revises: 16b09e90aed5
+Create Date: 2026-10-16 10:12:44.318202
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e2f1a6b3d'
+down_revision: Union[str, Sequence[str], None] = '16b09e90aed5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# transactions and transaction_status_history get UUIDv7 keys from the application
+TABLES = ('fees',)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gen_random_uuid() is built in from PostgreSQL 13, pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,30 @@
+"""transaction_list_composite_indexes
+
+Revision ID: a2c6e8d4f193
+Revises: e3f19a7c5b40
+Create Date: 2026-10-16 13:02:51.664270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c6e8d4f193'
+down_revision: Union[str, Sequence[str], None] = 'e3f19a7c5b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # idx_transaction_timestamp_id already comes from b71d3e5c9a20
+    op.create_index('idx_transaction_status_timestamp', 'transactions', ['status', 'timestamp', 'id'], unique=False)
+    op.drop_index('idx_transaction_status', table_name='transactions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_transaction_status', 'transactions', ['status'], unique=False)
+    op.drop_index('idx_transaction_status_timestamp', table_name='transactions')
@@ -0,0 +1,38 @@
+"""add_filter_indexes
+
+Revision ID: b71d3e5c9a20
+Revises: 9c4e2f1a6b3d
+Create Date: 2026-10-16 11:03:27.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71d3e5c9a20'
+down_revision: Union[str, Sequence[str], None] = '9c4e2f1a6b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_country_currency_id', 'countries', ['currency_id'], unique=False)
+    op.create_index(
+        'idx_country_can_send', 'countries', ['can_send'], unique=False,
+        postgresql_where=sa.text('can_send'),
+    )
+    op.create_index('idx_transaction_sender_created', 'transactions', ['sender_id', 'created_at'], unique=False)
+    # (timestamp, id) matches the keyset ordering of the transaction list
+    op.create_index('idx_transaction_timestamp_id', 'transactions', ['timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_transaction_timestamp_id', table_name='transactions')
+    op.drop_index('idx_transaction_sender_created', table_name='transactions')
+    op.drop_index('idx_country_can_send', table_name='countries', postgresql_where=sa.text('can_send'))
+    op.drop_index('idx_country_currency_id', table_name='countries')
@@ -0,0 +1,41 @@
+"""lowercase_user_emails
+
+Revision ID: c7b1e5a9d2f4
+Revises: a2c6e8d4f193
+Create Date: 2026-10-16 15:21:07.418302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7b1e5a9d2f4'
+down_revision: Union[str, Sequence[str], None] = 'a2c6e8d4f193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Emails are lower-cased on write from now on; bring existing rows in line so the
+    # plain unique btree on users.email keeps serving every lookup
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1"
+    )).scalars().all()
+    if duplicates:
+        # Lower-casing would violate the unique constraint midway; these accounts
+        # must be merged or re-addressed by hand before upgrading
+        raise RuntimeError(
+            "Cannot lower-case users.email: accounts differ only by case for "
+            + ", ".join(sorted(duplicates))
+        )
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The original casing is not recoverable; lower-cased emails stay valid
+    pass
@@ -0,0 +1,32 @@
+"""server_side_timestamps
+
+Revision ID: d4a8f0b2e617
+Revises: b71d3e5c9a20
+Create Date: 2026-10-16 11:48:09.527331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8f0b2e617'
+down_revision: Union[str, Sequence[str], None] = 'b71d3e5c9a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('users', 'created_at', server_default=sa.text('now()'))
+    op.alter_column('users', 'updated_at', server_default=sa.text('now()'))
+    op.alter_column('transactions', 'timestamp', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('transactions', 'timestamp', server_default=None)
+    op.alter_column('users', 'updated_at', server_default=None)
+    op.alter_column('users', 'created_at', server_default=None)
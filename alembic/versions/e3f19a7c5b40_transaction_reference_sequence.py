@@ -0,0 +1,35 @@
+"""transaction_reference_sequence
+
+Revision ID: e3f19a7c5b40
+Revises: d4a8f0b2e617
+Create Date: 2026-10-16 12:21:37.104518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3f19a7c5b40'
+down_revision: Union[str, Sequence[str], None] = 'd4a8f0b2e617'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REFERENCE_DEFAULT = "'TX' || lpad(nextval('transaction_ref_seq')::text, 10, '0')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence('transaction_ref_seq')))
+    op.alter_column('transactions', 'reference', server_default=sa.text(REFERENCE_DEFAULT))
+    op.execute(f"UPDATE transactions SET reference = {REFERENCE_DEFAULT} WHERE reference IS NULL")
+    op.alter_column('transactions', 'reference', nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('transactions', 'reference', nullable=True)
+    op.alter_column('transactions', 'reference', server_default=None)
+    op.execute(sa.schema.DropSequence(sa.Sequence('transaction_ref_seq')))
@@ -0,0 +1,54 @@
+"""user_role_enum
+
+Revision ID: e8d2a4c6f071
+Revises: c7b1e5a9d2f4
+Create Date: 2026-10-16 15:48:33.902514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8d2a4c6f071'
+down_revision: Union[str, Sequence[str], None] = 'c7b1e5a9d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same labels as the VARCHAR values already stored, so the cast needs no rewrite
+user_role_enum = postgresql.ENUM(
+    'admin',
+    'user',
+    'agent',
+    name='user_role'
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    user_role_enum.create(op.get_bind())
+    op.alter_column(
+        'users',
+        'role',
+        type_=user_role_enum,
+        existing_type=sa.VARCHAR(),
+        existing_nullable=False,
+        postgresql_using="role::user_role"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'users',
+        'role',
+        type_=sa.VARCHAR(),
+        existing_type=user_role_enum,
+        existing_nullable=False,
+        postgresql_using="role::text"
+    )
+    user_role_enum.drop(op.get_bind())
@@ -1,4 +1,7 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from src.api.endpoints.v1 import currency, rates, country, receiving_type, payment_method, transaction, fees, fcm_token, exchange_rates, user, \
@@ -6,11 +9,25 @@ from src.api.endpoints.v1 import currency, rates, country, receiving_type, payme
 
 from src.api.endpoints.v1.admin_transactions import router as admin_transaction_router
 from src.api.endpoints.v1.ws_routes import router as ws_router
+from src.db.session import engine, replica_engine, warm_up_pool
 
 version = 'v1'
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_up_pool()
+    yield
+    await engine.dispose()
+    if replica_engine is not engine:
+        await replica_engine.dispose()
+
+
 app = FastAPI(
     title="Chapmoney APIs",
-    version=version
+    version=version,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -1,7 +1,8 @@
 
-from datetime import datetime, timezone
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, update
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.auth.permission import agent_or_admin_required
@@ -15,18 +16,21 @@ router = APIRouter(prefix="/admin", tags=["Admin - Transactions"])
 
 
 # ============================================
-# TRANSITIONS VALIDES
+# TRANSITIONS VALIDES (VALID_TRANSITIONS : src.schemas.transaction)
 # ============================================
 
-VALID_TRANSITIONS: dict[TransactionStatus, set[TransactionStatus]] = {
-    TransactionStatus.FUNDS_DEPOSITED: {
-        TransactionStatus.IN_PROGRESS,
-        TransactionStatus.CANCELLED,
-    },
-    TransactionStatus.IN_PROGRESS: {
-        TransactionStatus.COMPLETED,
-        TransactionStatus.CANCELLED,
-    },
+# Statuts de départ autorisés pour chaque statut cible, calculés une fois à l'import
+_ALLOWED_FROM: dict[TransactionStatus, tuple[TransactionStatus, ...]] = {
+    target: tuple(source for source, targets in VALID_TRANSITIONS.items() if target in targets)
+    for target in TransactionStatus
+}
+
+# Horodatage métier posé avec le changement de statut
+_STATUS_TIMESTAMP: dict[TransactionStatus, str] = {
+    TransactionStatus.IN_PROGRESS: "processed_at",
+    TransactionStatus.COMPLETED: "completed_at",
+    TransactionStatus.CANCELLED: "cancelled_at",
+    TransactionStatus.EXPIRED: "expired_at",
 }
 
 
@@ -54,49 +58,55 @@ async def update_transaction_status(
     ✅ Notifie automatiquement l'utilisateur via WebSocket.
     """
 
-    # 1. Récupérer la transaction
-    transaction = await db.get(Transaction, transaction_id)
-
-    if not transaction:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Transaction introuvable",
-        )
+    # ============================================
+    # 1️⃣ Transition + update métier en un seul UPDATE ... RETURNING
+    # ============================================
 
-    old_status = transaction.status
+    allowed_from = _ALLOWED_FROM.get(body.new_status, ())
 
-    # 2. Valider la transition
-    allowed = VALID_TRANSITIONS.get(old_status, set())
+    values = {"status": body.new_status}
+    timestamp_column = _STATUS_TIMESTAMP.get(body.new_status)
+    if timestamp_column:
+        values[timestamp_column] = func.now()
+    if body.new_status == TransactionStatus.IN_PROGRESS:
+        values["processed_by_admin_id"] = admin.id
+
+    # Ligne verrouillée pour lire l'ancien statut dans la même requête
+    previous = (
+        select(Transaction.id, Transaction.status)
+        .where(Transaction.id == transaction_id)
+        .with_for_update()
+        .subquery()
+    )
+    stmt = (
+        update(Transaction)
+        .where(Transaction.id == previous.c.id, Transaction.status.in_(allowed_from))
+        .values(**values)
+        .returning(Transaction, previous.c.status)
+        .execution_options(synchronize_session=False)
+    )
+    row = (await db.execute(stmt)).one_or_none()
 
-    if body.new_status not in allowed:
+    if row is None:
+        # Chemin d'erreur uniquement : distinguer 404 et transition invalide
+        current_status = await db.scalar(
+            select(Transaction.status).where(Transaction.id == transaction_id)
+        )
+        if current_status is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Transaction introuvable",
+            )
+        allowed = VALID_TRANSITIONS.get(current_status, set())
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
-                f"Transition invalide: {old_status} → {body.new_status}. "
+                f"Transition invalide: {current_status} → {body.new_status}. "
                 f"Transitions autorisées: {[s.value for s in allowed]}"
             ),
         )
 
-    # ============================================
-    # 1️⃣ Update métier selon statut
-    # ============================================
-
-    now = datetime.now(timezone.utc)
-
-    if body.new_status == TransactionStatus.IN_PROGRESS:
-        transaction.processed_at = now
-        transaction.processed_by_admin_id = admin.id
-
-    elif body.new_status == TransactionStatus.COMPLETED:
-        transaction.completed_at = now
-
-    elif body.new_status == TransactionStatus.CANCELLED:
-        transaction.cancelled_at = now
-
-    elif body.new_status == TransactionStatus.EXPIRED:
-        transaction.expired_at = now
-
-    transaction.status = body.new_status
+    transaction, old_status = row
 
     # ============================================
     # 2️⃣ Audit history (critique en fintech)
@@ -113,7 +123,6 @@ async def update_transaction_status(
     db.add(history)
 
     await db.commit()
-    await db.refresh(transaction)
 
     # 4. ✅ Notifier l'utilisateur via WebSocket
     await ws_manager.notify_user(
@@ -2,9 +2,10 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, status, Depends, HTTPException, Query, Response
+from sqlalchemy import exists, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from src.auth.permission import admin_required
 from src.db.models import Country, Currency
@@ -21,6 +22,16 @@ from src.schemas.common import SuccessResponse
 
 router = APIRouter()
 
+# Loader option bundles are built once at import and shared by every query below
+_CURRENCY_OPTIONS = (joinedload(Country.currency),)
+_CURRENCY_READ_OPTIONS = (*_CURRENCY_OPTIONS, raiseload("*"))
+_METHODS_OPTIONS = (
+    joinedload(Country.currency),
+    selectinload(Country.payment_types),
+    selectinload(Country.receiving_types),
+)
+_METHODS_READ_OPTIONS = (*_METHODS_OPTIONS, raiseload("*"))
+
 
 # ============================================
 # DEPENDENCY FUNCTIONS
@@ -31,11 +42,7 @@ async def get_country_or_404(
     session: AsyncSession = Depends(get_session)
 ) -> Country:
     """Get country by ID or raise 404"""
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    ).where(Country.id == country_id)
+    stmt = select(Country).options(*_METHODS_OPTIONS).where(Country.id == country_id)
     
     result = await session.execute(stmt)
     country = result.scalar_one_or_none()
@@ -51,30 +58,24 @@ async def get_country_or_404(
 
 async def validate_country_code(code_iso: str, session: AsyncSession) -> None:
     """Validate that a country code doesn't already exist"""
-    stmt = select(Country).where(Country.code_iso == code_iso.upper())
-    result = await session.execute(stmt)
-    existing = result.scalar_one_or_none()
+    stmt = select(exists().where(Country.code_iso == code_iso.upper()))
     
-    if existing:
+    if await session.scalar(stmt):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Le pays avec le code ISO '{code_iso}' existe déjà"
         )
 
 
-async def validate_currency_exists(currency_id: UUID, session: AsyncSession) -> Currency:
+async def validate_currency_exists(currency_id: UUID, session: AsyncSession) -> None:
     """Validate that currency exists"""
-    stmt = select(Currency).where(Currency.id == currency_id)
-    result = await session.execute(stmt)
-    currency = result.scalar_one_or_none()
+    stmt = select(exists().where(Currency.id == currency_id))
     
-    if not currency:
+    if not await session.scalar(stmt):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Devise avec l'ID {currency_id} non trouvée"
         )
-    
-    return currency
 
 
 # ============================================
@@ -110,11 +111,7 @@ async def create_country(
     await session.commit()
     
     # Reload with relationships
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    ).where(Country.id == country.id)
+    stmt = select(Country).options(*_CURRENCY_OPTIONS).where(Country.id == country.id)
     
     result = await session.execute(stmt)
     country_with_relations = result.scalar_one()
@@ -149,11 +146,8 @@ async def get_countries(
     """
     # Build query with optional relationships
     if include_relations:
-        stmt = select(Country).options(
-            selectinload(Country.currency),
-            selectinload(Country.payment_types),
-            selectinload(Country.receiving_types)
-        )
+        # CountryModel only exposes the currency; the method lists are never serialised
+        stmt = select(Country).options(*_CURRENCY_READ_OPTIONS)
     else:
         stmt = select(Country)
     
@@ -229,11 +223,7 @@ async def get_country_by_code(
     
     Exemple: /code/US pour obtenir les États-Unis
     """
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    ).where(Country.code_iso == code_iso.upper())
+    stmt = select(Country).options(*_CURRENCY_READ_OPTIONS).where(Country.code_iso == code_iso.upper())
     
     result = await session.execute(stmt)
     country = result.scalar_one_or_none()
@@ -264,11 +254,7 @@ async def get_countries_by_currency(
     # Validate currency exists
     await validate_currency_exists(currency_id, session)
     
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    ).where(Country.currency_id == currency_id).order_by(Country.name)
+    stmt = select(Country).options(*_CURRENCY_READ_OPTIONS).where(Country.currency_id == currency_id).order_by(Country.name)
     
     result = await session.execute(stmt)
     countries = result.scalars().all()
@@ -312,11 +298,7 @@ async def update_country(
     await session.commit()
     
     # Reload with relationships
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    ).where(Country.id == country.id)
+    stmt = select(Country).options(*_CURRENCY_OPTIONS).where(Country.id == country.id)
     
     result = await session.execute(stmt)
     updated_country = result.scalar_one()
@@ -426,18 +408,19 @@ async def get_countries_simple(
     Utile pour les dropdowns dans Flutter où vous n'avez besoin que
     de l'ID, du nom et du code ISO.
     """
-    stmt = select(Country).order_by(Country.name)
+    # Only the three rendered columns: plain rows, no Country entities
+    stmt = select(Country.id, Country.name, Country.code_iso).order_by(Country.name)
     result = await session.execute(stmt)
-    countries = result.scalars().all()
     
+    # Trusted DB rows: model_construct builds them without validation, and response_model
+    # does not revalidate model instances (revalidate_instances='never'), so only serialization runs
     return [
-        CountrySimple(
-            id=c.id,
-            name=c.name,
-            code_iso=c.code_iso,
-
+        CountrySimple.model_construct(
+            id=row.id,
+            name=row.name,
+            code_iso=row.code_iso,
         )
-        for c in countries
+        for row in result
     ]
 
 
@@ -473,48 +456,45 @@ async def create_multiple_countries(
     created = []
     skipped = []
     errors = []
+    rows = []
+    
+    # Resolve existing codes and known currencies up front: two queries per batch
+    existing_stmt = select(Country.code_iso).where(
+        Country.code_iso.in_({c.code_iso.upper() for c in countries_data})
+    )
+    existing = set(await session.scalars(existing_stmt))
+    currency_stmt = select(Currency.id).where(
+        Currency.id.in_({c.currency_id for c in countries_data})
+    )
+    currency_ids = set(await session.scalars(currency_stmt))
     
     for country_data in countries_data:
-        try:
-            # Check if exists
-            stmt = select(Country).where(Country.code_iso == country_data.code_iso.upper())
-            result = await session.execute(stmt)
-            existing = result.scalar_one_or_none()
-            
-            if existing:
-                skipped.append({
-                    'code_iso': country_data.code_iso.upper(),
-                    'name': country_data.name,
-                    'reason': 'Code ISO already exists'
-                })
-                continue
-            
-            # Validate currency exists
-            currency_stmt = select(Currency).where(Currency.id == country_data.currency_id)
-            currency_result = await session.execute(currency_stmt)
-            currency = currency_result.scalar_one_or_none()
-            
-            if not currency:
-                errors.append({
-                    'name': country_data.name,
-                    'reason': f'Currency ID {country_data.currency_id} not found'
-                })
-                continue
-            
-            # Create country
-            country = Country(**country_data.model_dump())
-            session.add(country)
-            created.append({
-                'name': country.name,
-                'code_iso': country.code_iso
+        code_iso = country_data.code_iso.upper()
+        if code_iso in existing:
+            skipped.append({
+                'code_iso': code_iso,
+                'name': country_data.name,
+                'reason': 'Code ISO already exists'
             })
-            
-        except Exception as e:
+            continue
+        
+        if country_data.currency_id not in currency_ids:
             errors.append({
                 'name': country_data.name,
-                'reason': str(e)
+                'reason': f'Currency ID {country_data.currency_id} not found'
             })
-    
+            continue
+        
+        rows.append(country_data.model_dump())
+        existing.add(code_iso)
+        created.append({
+            'name': country_data.name,
+            'code_iso': code_iso
+        })
+    
+    if rows:
+        # Single executemany INSERT for the whole batch
+        await session.execute(insert(Country), rows)
     await session.commit()
     
     return {
@@ -553,11 +533,7 @@ async def get_country_with_methods(
     // Afficher receiving_types dans un autre dropdown
     ```
     """
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    ).where(Country.id == country_id)
+    stmt = select(Country).options(*_METHODS_READ_OPTIONS).where(Country.id == country_id)
     
     result = await session.execute(stmt)
     country = result.scalar_one_or_none()
@@ -586,11 +562,7 @@ async def get_country_by_code_with_methods(
     Exemple: /code/US/with-methods pour obtenir les États-Unis
     avec toutes les méthodes de paiement et réception disponibles.
     """
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    ).where(Country.code_iso == code_iso.upper())
+    stmt = select(Country).options(*_METHODS_READ_OPTIONS).where(Country.code_iso == code_iso.upper())
     
     result = await session.execute(stmt)
     country = result.scalar_one_or_none()
@@ -627,11 +599,7 @@ async def get_all_countries_with_methods(
     - GET /countries/with-methods/list?can_send=true → Pays d'envoi uniquement
     - GET /countries/with-methods/list?currency_id=uuid → Pays utilisant une devise
     """
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    )
+    stmt = select(Country).options(*_METHODS_READ_OPTIONS)
     
     # Apply filters
     if can_send is not None:
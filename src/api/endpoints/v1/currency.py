@@ -2,6 +2,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, status, Depends, HTTPException, Query
+from sqlalchemy import exists, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy_utils import Currency as CurrencyType
 from sqlmodel import select, func
@@ -16,6 +17,7 @@ from src.schemas.currency import (
     CurrencyList,
 )
 from src.schemas.common import SuccessResponse
+from src.services.reference_cache import invalidate_currency_cache
 
 router = APIRouter()
 
@@ -29,9 +31,7 @@ async def get_currency_or_404(
     session: AsyncSession = Depends(get_session)
 ) -> Currency:
     """Get currency by ID or raise 404"""
-    stmt = select(Currency).where(Currency.id == currency_id)
-    result = await session.execute(stmt)
-    currency = result.scalar_one_or_none()
+    currency = await session.get(Currency, currency_id)
     
     if not currency:
         raise HTTPException(
@@ -42,13 +42,20 @@ async def get_currency_or_404(
     return currency
 
 
-async def validate_currency_code(code: str, session: AsyncSession) -> None:
+async def validate_currency_code(
+    code: str,
+    session: AsyncSession,
+    exclude_currency_id: Optional[UUID] = None
+) -> None:
     """Validate that a currency code doesn't already exist"""
-    stmt = select(Currency).where(Currency.code == code.upper())
-    result = await session.execute(stmt)
-    existing = result.scalar_one_or_none()
+    condition = Currency.code == code.upper()
     
-    if existing:
+    if exclude_currency_id:
+        condition &= Currency.id != exclude_currency_id
+    
+    stmt = select(exists().where(condition))
+    
+    if await session.scalar(stmt):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"La devise avec le code '{code}' existe déjà"
@@ -102,6 +109,7 @@ async def create_currency(
     
     session.add(currency)
     await session.commit()
+    invalidate_currency_cache()
     await session.refresh(currency)
     
     return currency
@@ -215,8 +223,8 @@ async def get_currency_by_code(
     dependencies=[Depends(admin_required)]
 )
 async def update_currency(
+    currency_id: UUID,
     update_data: CurrencyUpdate,
-    currency: Currency = Depends(get_currency_or_404),
     session: AsyncSession = Depends(get_session)
 ):
     """
@@ -226,18 +234,32 @@ async def update_currency(
     pour éviter les doublons.
     """
     update_dict = update_data.model_dump(exclude_unset=True)
+    if not update_dict:
+        return await get_currency_or_404(currency_id, session)
+    
+    # If updating code, check no other currency already uses it
+    if 'code' in update_dict:
+        await validate_currency_code(update_dict['code'], session, exclude_currency_id=currency_id)
+    
+    # UPDATE ... RETURNING: no prior SELECT and no refresh afterwards
+    stmt = (
+        update(Currency)
+        .where(Currency.id == currency_id)
+        .values(**update_dict)
+        .returning(Currency)
+        .execution_options(synchronize_session=False)
+    )
+    currency = (await session.execute(stmt)).scalar_one_or_none()
     
-    # If updating code, check it doesn't already exist
-    if 'code' in update_dict and update_dict['code'] != currency.code:
-        await validate_currency_code(update_dict['code'], session)
-    
-    # Apply updates
-    for key, value in update_dict.items():
-        setattr(currency, key, value)
+    if not currency:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Devise avec l'ID {currency_id} non trouvée"
+        )
     
-    session.add(currency)
     await session.commit()
-    await session.refresh(currency)
+    # The code may have changed: drop cached code -> id entries
+    invalidate_currency_cache()
     
     return currency
 
@@ -261,6 +283,7 @@ async def delete_currency(
     try:
         await session.delete(currency)
         await session.commit()
+        invalidate_currency_cache()
         
         return SuccessResponse(
             message=f"Devise '{currency.code}' supprimée avec succès"
@@ -311,6 +334,7 @@ async def delete_all_currencies(
             await session.delete(currency)
         
         await session.commit()
+        invalidate_currency_cache()
         
         return {
             "message": "Toutes les devises ont été supprimées",
@@ -386,30 +410,28 @@ async def create_multiple_currencies(
     created = []
     skipped = []
     errors = []
+    rows = []
+    
+    # One query for every code already present instead of one per code
+    stmt = select(Currency.code).where(Currency.code.in_({code.upper() for code in currency_codes}))
+    existing = set(await session.scalars(stmt))
     
     for code in currency_codes:
+        if code.upper() in existing:
+            skipped.append({
+                'code': code.upper(),
+                'reason': 'Already exists'
+            })
+            continue
+        
         try:
-            # Check if exists
-            stmt = select(Currency).where(Currency.code == code.upper())
-            result = await session.execute(stmt)
-            existing = result.scalar_one_or_none()
-            
-            if existing:
-                skipped.append({
-                    'code': code.upper(),
-                    'reason': 'Already exists'
-                })
-                continue
-            
-            # Create currency
             currency_type = CurrencyType(code.upper())
-            currency = Currency(
-                code=currency_type.code,
-                name=currency_type.name,
-                symbol=currency_type.symbol
-            )
-            
-            session.add(currency)
+            rows.append({
+                'code': currency_type.code,
+                'name': currency_type.name,
+                'symbol': currency_type.symbol
+            })
+            existing.add(currency_type.code)
             created.append(currency_type.code)
             
         except ValueError:
@@ -423,7 +445,11 @@ async def create_multiple_currencies(
                 'reason': str(e)
             })
     
+    if rows:
+        # Single executemany INSERT for the whole batch
+        await session.execute(insert(Currency), rows)
     await session.commit()
+    invalidate_currency_cache()
     
     return {
         'message': f'{len(created)} devise(s) créée(s) avec succès',
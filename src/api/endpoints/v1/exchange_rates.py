@@ -5,7 +5,8 @@ from datetime import datetime
 
 from fastapi import APIRouter, status, HTTPException, Depends, Response, Query
 from sqlmodel import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, update
+from sqlalchemy.orm import aliased
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.auth.permission import admin_required
@@ -22,14 +23,13 @@ from src.schemas.exchange_rate import (
     ExchangeRateQuery,
     ExchangeRateResponse
 )
+from src.services.reference_cache import currency_id_by_code, invalidate_exchange_rate_cache
 
 router = APIRouter()
 
 
 async def get_exchange_rate_or_404(id: uuid.UUID, session: AsyncSession = Depends(get_session)):
-    stmt = select(ExchangeRates).where(ExchangeRates.id == id)
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
+    return await session.get(ExchangeRates, id)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, dependencies=[Depends(admin_required)])
@@ -37,22 +37,18 @@ async def create_exchange_rate(
         rate_data: CreateExchangeRate,
         session: AsyncSession = Depends(get_session)
 ):
-    from_currency_result = await session.execute(
-        select(Currency).where(Currency.id == rate_data.from_currency_id)
-    )
-    to_currency_result = await session.execute(
-        select(Currency).where(Currency.id == rate_data.to_currency_id)
-    )
-
-    from_currency = from_currency_result.scalar_one_or_none()
-    to_currency = to_currency_result.scalar_one_or_none()
+    found = set(await session.scalars(
+        select(Currency.id).where(
+            Currency.id.in_((rate_data.from_currency_id, rate_data.to_currency_id))
+        )
+    ))
 
-    if not from_currency:
+    if rate_data.from_currency_id not in found:
         raise HTTPException(
             status_code=404,
             detail="Devise source non trouvée!"
         )
-    if not to_currency:
+    if rate_data.to_currency_id not in found:
         raise HTTPException(
             status_code=404,
             detail="Devise cible non trouvée!"
@@ -62,6 +58,7 @@ async def create_exchange_rate(
     session.add(exchange_rate)
     await session.commit()
     await session.refresh(exchange_rate)
+    invalidate_exchange_rate_cache()
 
     return {"message": "Taux de change ajouté avec succès! 🎉"}
 
@@ -75,43 +72,68 @@ async def get_exchange_rates(session: AsyncSession = Depends(get_session)):
 
 @router.get("/public" , status_code=status.HTTP_200_OK, response_model=List[ExchangeRateListResponse])
 async def get_exchange_rates_public(session: AsyncSession = Depends(get_session)):
-    stmt = select(ExchangeRates).options(
-        selectinload(ExchangeRates.from_currency),
-        selectinload(ExchangeRates.to_currency)
+    # Only the rendered columns, with both currency codes joined in: plain rows, no entities
+    from_currency = aliased(Currency)
+    to_currency = aliased(Currency)
+    stmt = select(
+        ExchangeRates.id,
+        ExchangeRates.rate,
+        from_currency.code.label("from_code"),
+        to_currency.code.label("to_code"),
+    ).join(
+        from_currency, from_currency.id == ExchangeRates.from_currency_id
+    ).join(
+        to_currency, to_currency.id == ExchangeRates.to_currency_id
     ).order_by(ExchangeRates.id)
     results = await session.execute(stmt)
-    rates = results.scalars().all()
     return [
         ExchangeRateListResponse(
-            id=rate.id,
-            from_currency=rate.from_currency.code,
-            to_currency=rate.to_currency.code,
-            rate=float(rate.rate),
-        ) for rate in rates
+            id=row.id,
+            from_currency=row.from_code,
+            to_currency=row.to_code,
+            rate=float(row.rate),
+        ) for row in results
     ]
 
 @router.patch("/{id}", status_code=status.HTTP_200_OK, response_model=ExchangeRateRead, dependencies=[Depends(admin_required)])
 async def update_exchange_rate(
+        id: uuid.UUID,
         update_rate_data: UpdateExchangeRate,
-        exchange_rate: ExchangeRates = Depends(get_exchange_rate_or_404),
         session: AsyncSession = Depends(get_session)
 ):
     update_rate_data_dict = update_rate_data.model_dump(exclude_unset=True)
-    for key, value in update_rate_data_dict.items():
-        setattr(exchange_rate, key, value)
-    await session.commit()
-    await session.refresh(exchange_rate)
+    if update_rate_data_dict:
+        # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        stmt = (
+            update(ExchangeRates)
+            .where(ExchangeRates.id == id)
+            .values(**update_rate_data_dict)
+            .returning(ExchangeRates)
+            .execution_options(synchronize_session=False)
+        )
+        exchange_rate = (await session.execute(stmt)).scalar_one_or_none()
+        await session.commit()
+        invalidate_exchange_rate_cache()
+    else:
+        exchange_rate = await get_exchange_rate_or_404(id, session)
+    if not exchange_rate:
+        raise HTTPException(status_code=404, detail="Taux de change non trouvé!")
 
     return exchange_rate
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(admin_required)])
 async def delete_exchange_rate(
-        exchange_rate=Depends(get_exchange_rate_or_404),
+        id: uuid.UUID,
         session: AsyncSession = Depends(get_session)
 ):
-    await session.delete(exchange_rate)
+    deleted_id = await session.scalar(
+        delete(ExchangeRates).where(ExchangeRates.id == id).returning(ExchangeRates.id)
+    )
+    if deleted_id is None:
+        raise HTTPException(status_code=404, detail="Taux de change non trouvé!")
     await session.commit()
+    invalidate_exchange_rate_cache()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -145,14 +167,15 @@ async def convert_currency_post(
     to_currency_upper = conversion_data.to_currency
 
     # Vérifier que les devises existent
-    from_currency_db = await _get_currency_by_code(session, from_currency_upper)
-    to_currency_db = await _get_currency_by_code(session, to_currency_upper)
+    from_currency_id, to_currency_id = await _get_currency_ids_by_codes(
+        session, from_currency_upper, to_currency_upper
+    )
 
     # Récupérer le taux de change
     exchange_rate = await _get_exchange_rate(
         session, 
-        from_currency_db.id, 
-        to_currency_db.id,
+        from_currency_id, 
+        to_currency_id,
         from_currency_upper,
         to_currency_upper
     )
@@ -251,13 +274,14 @@ async def get_exchange_rate_info(
     from_currency_upper = from_currency.upper()
     to_currency_upper = to_currency.upper()
 
-    from_currency_db = await _get_currency_by_code(session, from_currency_upper)
-    to_currency_db = await _get_currency_by_code(session, to_currency_upper)
+    from_currency_id, to_currency_id = await _get_currency_ids_by_codes(
+        session, from_currency_upper, to_currency_upper
+    )
 
     exchange_rate = await _get_exchange_rate(
         session,
-        from_currency_db.id,
-        to_currency_db.id,
+        from_currency_id,
+        to_currency_id,
         from_currency_upper,
         to_currency_upper
     )
@@ -272,20 +296,27 @@ async def get_exchange_rate_info(
 
 
 # Fonctions utilitaires
-async def _get_currency_by_code(session: AsyncSession, currency_code: str) -> Currency:
-    """Récupère une devise par son code ou lève une exception"""
-    result = await session.execute(
-        select(Currency).where(Currency.code == currency_code)
-    )
-    currency = result.scalar_one_or_none()
-    
-    if not currency:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"La devise '{currency_code}' n'existe pas"
+async def _get_currency_ids_by_codes(session: AsyncSession, *currency_codes: str) -> tuple[uuid.UUID, ...]:
+    """Récupère les IDs des devises par leur code ou lève une exception"""
+    missing = {code for code in currency_codes if code not in currency_id_by_code}
+    if missing:
+        # One IN-list round-trip for every uncached code; only the key is selected
+        result = await session.execute(
+            select(Currency.code, Currency.id).where(Currency.code.in_(missing))
         )
-    
-    return currency
+        for code, currency_id in result.all():
+            currency_id_by_code[code] = currency_id
+
+    currency_ids = []
+    for currency_code in currency_codes:
+        currency_id = currency_id_by_code.get(currency_code)
+        if currency_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"La devise '{currency_code}' n'existe pas"
+            )
+        currency_ids.append(currency_id)
+    return tuple(currency_ids)
 
 
 async def _get_exchange_rate(
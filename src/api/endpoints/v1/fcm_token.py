@@ -2,12 +2,13 @@ import uuid
 from typing import List
 
 from fastapi import APIRouter, status, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.db.models import FCMToken
-from src.db.session import get_session
-from src.schemas.fcm_token import FCMToken as FCMTokenModel, TokenRequest
+from src.db.session import Session, get_session
+from src.schemas.fcm_token import FCM_TOKEN_LIST_ADAPTER, FCMToken as FCMTokenModel, TokenRequest
 
 router = APIRouter()
 
@@ -19,12 +20,24 @@ async def store_token(token_data: TokenRequest, session: AsyncSession = Depends(
 	await session.refresh(new_token)
 	return {"message": "Token was stored successful!"}
 
+async def _stream_tokens_json():
+	# Plain (pk, token) rows off a server-side cursor: no ORM entities, memory bounded by the batch
+	stmt = select(FCMToken.pk, FCMToken.token).execution_options(yield_per=1000)
+	async with Session() as session:
+		rows = await session.stream(stmt)
+		yield b"["
+		separator = b""
+		# One validate + dump per chunk instead of per row; [1:-1] drops the chunk's own brackets
+		async for chunk in rows.partitions():
+			batch = FCM_TOKEN_LIST_ADAPTER.validate_python(chunk, from_attributes=True)
+			yield separator + FCM_TOKEN_LIST_ADAPTER.dump_json(batch)[1:-1]
+			separator = b","
+		yield b"]"
+
 @router.get("", status_code=status.HTTP_200_OK, response_model=List[FCMTokenModel])
-async def get_tokens(session: AsyncSession = Depends(get_session)):
-	stmt = select(FCMToken)
-	results = await session.execute(stmt)
-	tokens = results.scalars().all()
-	return tokens
+async def get_tokens():
+	# response_model only documents the schema: a StreamingResponse is sent as is
+	return StreamingResponse(_stream_tokens_json(), media_type="application/json")
 
 @router.get('/{pk}', status_code=status.HTTP_200_OK, response_model=FCMTokenModel)
 async def get_token(
@@ -3,9 +3,10 @@ from uuid import UUID
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import delete, exists, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased
 
 from src.auth.permission import admin_required
 from src.db.models import Fee, Country
@@ -20,6 +21,8 @@ from src.schemas.fees import (
     FeeList,
 )
 from src.schemas.common import SuccessResponse
+from src.schemas.country import CountrySimple
+from src.services.reference_cache import invalidate_fee_cache
 
 router = APIRouter()
 
@@ -33,9 +36,7 @@ async def get_fee_or_404(
     session: AsyncSession = Depends(get_session)
 ) -> Fee:
     """Get fee by ID or raise 404"""
-    stmt = select(Fee).where(Fee.id == fee_id)
-    result = await session.execute(stmt)
-    fee = result.scalar_one_or_none()
+    fee = await session.get(Fee, fee_id)
     
     if not fee:
         raise HTTPException(
@@ -50,30 +51,24 @@ async def validate_countries_exist(
     from_country_id: UUID,
     to_country_id: UUID,
     session: AsyncSession
-) -> tuple[Country, Country]:
+) -> None:
     """Validate that both countries exist"""
-    from_stmt = select(Country).where(Country.id == from_country_id)
-    to_stmt = select(Country).where(Country.id == to_country_id)
-    
-    from_result = await session.execute(from_stmt)
-    to_result = await session.execute(to_stmt)
+    # Only the keys are needed: one round-trip, no Country rows built
+    found = set(await session.scalars(
+        select(Country.id).where(Country.id.in_((from_country_id, to_country_id)))
+    ))
     
-    from_country = from_result.scalar_one_or_none()
-    to_country = to_result.scalar_one_or_none()
-    
-    if not from_country:
+    if from_country_id not in found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pays source avec l'ID {from_country_id} non trouvé"
         )
     
-    if not to_country:
+    if to_country_id not in found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pays destination avec l'ID {to_country_id} non trouvé"
         )
-    
-    return from_country, to_country
 
 
 async def validate_fee_not_exists(
@@ -83,18 +78,12 @@ async def validate_fee_not_exists(
     exclude_fee_id: Optional[UUID] = None
 ) -> None:
     """Validate that fee doesn't already exist for this country pair"""
-    stmt = select(Fee).where(
-        Fee.from_country_id == from_country_id,
-        Fee.to_country_id == to_country_id
-    )
+    condition = (Fee.from_country_id == from_country_id) & (Fee.to_country_id == to_country_id)
     
     if exclude_fee_id:
-        stmt = stmt.where(Fee.id != exclude_fee_id)
+        condition &= Fee.id != exclude_fee_id
     
-    result = await session.execute(stmt)
-    existing = result.scalar_one_or_none()
-    
-    if existing:
+    if await session.scalar(select(exists().where(condition))):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Un frais existe déjà pour cette paire de pays"
@@ -146,6 +135,7 @@ async def create_fee(
     fee = Fee(**fee_data.model_dump())
     session.add(fee)
     await session.commit()
+    invalidate_fee_cache()
     await session.refresh(fee)
     
     return fee
@@ -158,7 +148,6 @@ async def create_fee(
 async def get_all_fees(
     from_country_id: Optional[UUID] = Query(None, description="Filtrer par pays source"),
     to_country_id: Optional[UUID] = Query(None, description="Filtrer par pays destination"),
-    fee_type: Optional[str] = Query(None, description="Filtrer par type (fixed ou percentage)"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
     session: AsyncSession = Depends(get_session)
@@ -169,7 +158,6 @@ async def get_all_fees(
     Paramètres:
     - from_country_id: Filtrer par pays source
     - to_country_id: Filtrer par pays destination
-    - fee_type: Filtrer par type ('fixed' ou 'percentage')
     - limit: Pagination
     - offset: Pagination
     """
@@ -182,14 +170,6 @@ async def get_all_fees(
     if to_country_id:
         stmt = stmt.where(Fee.to_country_id == to_country_id)
     
-    if fee_type:
-        if fee_type.lower() not in ['fixed', 'percentage']:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="fee_type doit être 'fixed' ou 'percentage'"
-            )
-        stmt = stmt.where(Fee.fee_type == fee_type.lower())
-    
     # Apply pagination
     stmt = stmt.order_by(Fee.created_at.desc()).offset(offset).limit(limit)
     
@@ -213,7 +193,22 @@ async def get_fees_with_countries(
     
     Utile pour afficher une liste complète dans l'interface Flutter.
     """
-    stmt = select(Fee)
+    # Both countries come back in the same row: one query for the whole list
+    from_country = aliased(Country)
+    to_country = aliased(Country)
+    stmt = select(
+        Fee,
+        from_country.id.label("from_id"),
+        from_country.name.label("from_name"),
+        from_country.code_iso.label("from_code_iso"),
+        to_country.id.label("to_id"),
+        to_country.name.label("to_name"),
+        to_country.code_iso.label("to_code_iso"),
+    ).join(
+        from_country, from_country.id == Fee.from_country_id
+    ).join(
+        to_country, to_country.id == Fee.to_country_id
+    )
     
     if from_country_id:
         stmt = stmt.where(Fee.from_country_id == from_country_id)
@@ -221,46 +216,22 @@ async def get_fees_with_countries(
         stmt = stmt.where(Fee.to_country_id == to_country_id)
     
     result = await session.execute(stmt)
-    fees = result.scalars().all()
     
-    # Load countries for each fee
-    fees_with_countries = []
-    for fee in fees:
-        from_stmt = select(Country).where(Country.id == fee.from_country_id)
-        to_stmt = select(Country).where(Country.id == fee.to_country_id)
-        
-        from_result = await session.execute(from_stmt)
-        to_result = await session.execute(to_stmt)
-        
-        from_country = from_result.scalar_one_or_none()
-        to_country = to_result.scalar_one_or_none()
-        
-        fee_data = FeeWithCountries(
-            id=fee.id,
-            from_country_id=fee.from_country_id,
-            to_country_id=fee.to_country_id,
-            fee=fee.fee,
-            fee_type=fee.fee_type,
-            min_amount=fee.min_amount,
-            max_amount=fee.max_amount,
-            created_at=fee.created_at,
-            updated_at=fee.updated_at,
-            from_country={
-                'id': from_country.id,
-                'name': from_country.name,
-                'code_iso': from_country.code_iso,
-                'flag_url': from_country.flag_url
-            } if from_country else None,
-            to_country={
-                'id': to_country.id,
-                'name': to_country.name,
-                'code_iso': to_country.code_iso,
-                'flag_url': to_country.flag_url
-            } if to_country else None
+    # Trusted DB rows: model_construct builds them without validation, and response_model
+    # does not revalidate model instances (revalidate_instances='never'), so only serialization runs
+    return [
+        FeeWithCountries.model_construct(
+            id=row.Fee.id,
+            from_country_id=row.Fee.from_country_id,
+            to_country_id=row.Fee.to_country_id,
+            fee=row.Fee.fee,
+            created_at=row.Fee.created_at,
+            updated_at=row.Fee.updated_at,
+            from_country=CountrySimple.model_construct(id=row.from_id, name=row.from_name, code_iso=row.from_code_iso),
+            to_country=CountrySimple.model_construct(id=row.to_id, name=row.to_name, code_iso=row.to_code_iso)
         )
-        fees_with_countries.append(fee_data)
-    
-    return fees_with_countries
+        for row in result
+    ]
 
 
 @router.get(
@@ -311,8 +282,8 @@ async def get_fee(
     dependencies=[Depends(admin_required)]
 )
 async def update_fee(
+    fee_id: UUID,
     fee_data: FeeUpdate,
-    fee: Fee = Depends(get_fee_or_404),
     session: AsyncSession = Depends(get_session)
 ):
     """
@@ -323,24 +294,47 @@ async def update_fee(
     - Si le type change en percentage, vérifie que fee <= 100
     """
     update_dict = fee_data.model_dump(exclude_unset=True)
+    if not update_dict:
+        return await get_fee_or_404(fee_id, session)
+    
+    # Check for country pair change: only the current pair is read, not the whole fee
+    if 'from_country_id' in update_dict or 'to_country_id' in update_dict:
+        current = (await session.execute(
+            select(Fee.from_country_id, Fee.to_country_id).where(Fee.id == fee_id)
+        )).one_or_none()
+        if current is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Frais avec l'ID {fee_id} non trouvé"
+            )
+        
+        new_from = update_dict.get('from_country_id', current.from_country_id)
+        new_to = update_dict.get('to_country_id', current.to_country_id)
+        
+        if (new_from != current.from_country_id or new_to != current.to_country_id):
+            # Validate countries exist
+            await validate_countries_exist(new_from, new_to, session)
+            # Validate no duplicate
+            await validate_fee_not_exists(new_from, new_to, session, exclude_fee_id=fee_id)
+    
+    # UPDATE ... RETURNING: no entity load before, no refresh after
+    stmt = (
+        update(Fee)
+        .where(Fee.id == fee_id)
+        .values(**update_dict)
+        .returning(Fee)
+        .execution_options(synchronize_session=False)
+    )
+    fee = (await session.execute(stmt)).scalar_one_or_none()
     
-    # Check for country pair change
-    new_from = update_dict.get('from_country_id', fee.from_country_id)
-    new_to = update_dict.get('to_country_id', fee.to_country_id)
-    
-    if (new_from != fee.from_country_id or new_to != fee.to_country_id):
-        # Validate countries exist
-        await validate_countries_exist(new_from, new_to, session)
-        # Validate no duplicate
-        await validate_fee_not_exists(new_from, new_to, session, exclude_fee_id=fee.id)
-    
-    # Apply updates
-    for key, value in update_dict.items():
-        setattr(fee, key, value)
+    if not fee:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Frais avec l'ID {fee_id} non trouvé"
+        )
     
-    session.add(fee)
     await session.commit()
-    await session.refresh(fee)
+    invalidate_fee_cache()
     
     return fee
 
@@ -383,6 +377,7 @@ async def replace_fee(
     
     session.add(fee)
     await session.commit()
+    invalidate_fee_cache()
     await session.refresh(fee)
     
     return fee
@@ -395,12 +390,21 @@ async def replace_fee(
     dependencies=[Depends(admin_required)]
 )
 async def delete_fee(
-    fee: Fee = Depends(get_fee_or_404),
+    fee_id: UUID,
     session: AsyncSession = Depends(get_session)
 ):
     """Supprimer un frais"""
-    await session.delete(fee)
+    # Existence check and delete in one round-trip
+    deleted_id = await session.scalar(
+        delete(Fee).where(Fee.id == fee_id).returning(Fee.id)
+    )
+    if deleted_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Frais avec l'ID {fee_id} non trouvé"
+        )
     await session.commit()
+    invalidate_fee_cache()
     
     return SuccessResponse(
         message=f"Frais supprimé avec succès"
@@ -428,18 +432,13 @@ async def delete_all_fees(
             detail="Veuillez confirmer avec ?confirm=true"
         )
     
-    count_stmt = select(func.count()).select_from(Fee)
-    count_result = await session.execute(count_stmt)
-    total_count = count_result.scalar_one()
-    
-    stmt = select(Fee)
-    result = await session.execute(stmt)
-    fees = result.scalars().all()
-    
-    for fee in fees:
-        await session.delete(fee)
+    # Fees have no dependants: one set-oriented DELETE replaces the count,
+    # the full load and the per-row deletes
+    result = await session.execute(delete(Fee))
+    total_count = result.rowcount
     
     await session.commit()
+    invalidate_fee_cache()
     
     return {
         "message": "Tous les frais ont été supprimés",
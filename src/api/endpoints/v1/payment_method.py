@@ -2,6 +2,7 @@ import uuid
 from typing import List
 
 from fastapi import APIRouter, status, HTTPException, Depends
+from sqlalchemy import delete, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -16,9 +17,7 @@ async def get_payment_type_or_404(
 		id: uuid.UUID,
 		session: AsyncSession = Depends(get_session)
 ):
-	stmt = select(PaymentType).where(PaymentType.id == id)
-	result = await session.execute(stmt)
-	payment_type = result.scalar_one_or_none()
+	payment_type = await session.get(PaymentType, id)
 	if not payment_type:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Payment type does not found")
 	return payment_type
@@ -50,24 +49,37 @@ async def get_payment_type(
 
 @router.patch("/{id}", response_model=PaymentTypeRead)
 async def update_payment_type(
+		id: uuid.UUID,
 		payment_data: PaymentTypeUpdate,
-		payment_type = Depends(get_payment_type_or_404),
 		session: AsyncSession = Depends(get_session)
 ):
 	payment_data_dict = payment_data.dict(exclude_unset=True)
-	for key, value in payment_data_dict.items():
-		setattr(payment_type, key, value)
-	session.add(payment_type)
+	if not payment_data_dict:
+		return await get_payment_type_or_404(id, session)
+	# One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+	stmt = (
+		update(PaymentType)
+		.where(PaymentType.id == id)
+		.values(**payment_data_dict)
+		.returning(PaymentType)
+		.execution_options(synchronize_session=False)
+	)
+	payment_type = (await session.execute(stmt)).scalar_one_or_none()
+	if not payment_type:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Payment type does not found")
 	await session.commit()
-	await session.refresh(payment_type)
 
 	return payment_type
 
 @router.delete("/{id}", dependencies=[Depends(admin_required)])
 async def delete_payment_type(
-		payment_type = Depends(get_payment_type_or_404),
+		id: uuid.UUID,
 		session: AsyncSession = Depends(get_session)
 ):
-	await session.delete(payment_type)
+	deleted_id = await session.scalar(
+		delete(PaymentType).where(PaymentType.id == id).returning(PaymentType.id)
+	)
+	if deleted_id is None:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Payment type does not found")
 	await session.commit()
 	return {"message": "Type de payment supprimé avec succès"}
\ No newline at end of file
@@ -2,6 +2,7 @@ import uuid
 from typing import List
 from fastapi import APIRouter, status, HTTPException
 from fastapi.params import Depends
+from sqlalchemy import delete, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -13,9 +14,7 @@ from src.schemas.rtype import ReceivingTypeRead, ReceivingTypeCreate, ReceivingT
 router = APIRouter()
 
 async def get_receiving_type_or_404(id: uuid.UUID, session: AsyncSession = Depends(get_session)):
-	stmt = select(ReceivingType).where(ReceivingType.id == id)
-	result = await session.execute(stmt)
-	receiving_type = result.scalar_one_or_none()
+	receiving_type = await session.get(ReceivingType, id)
 	if not receiving_type:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Type dont found")
 	return receiving_type
@@ -48,24 +47,37 @@ async def receiving_type(
 
 @router.patch("/update/{id}", status_code=status.HTTP_200_OK, response_model=ReceivingTypeRead, dependencies=[Depends(admin_required)])
 async def update_type(
+		id: uuid.UUID,
 		receiving_type_data: ReceivingTypeUpdate,
-		receiving_type = Depends(get_receiving_type_or_404),
 		session: AsyncSession = Depends(get_session)
 ):
 	receiving_type_data_dict = receiving_type_data.dict(exclude_unset=True)
-	for key, value in receiving_type_data_dict.items():
-		setattr(receiving_type, key, value)
-	session.add(receiving_type)
+	if not receiving_type_data_dict:
+		return await get_receiving_type_or_404(id, session)
+	# One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+	stmt = (
+		update(ReceivingType)
+		.where(ReceivingType.id == id)
+		.values(**receiving_type_data_dict)
+		.returning(ReceivingType)
+		.execution_options(synchronize_session=False)
+	)
+	receiving_type = (await session.execute(stmt)).scalar_one_or_none()
+	if not receiving_type:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Type dont found")
 	await session.commit()
-	await session.refresh(receiving_type)
 	return receiving_type
 
 
 @router.delete("/{id}", dependencies=[Depends(admin_required)])
 async def delete_receiving_type(
-		type_receiving = Depends(get_receiving_type_or_404),
+		id: uuid.UUID,
 		session: AsyncSession = Depends(get_session)
 ) -> dict:
-	await session.delete(type_receiving)
+	deleted_id = await session.scalar(
+		delete(ReceivingType).where(ReceivingType.id == id).returning(ReceivingType.id)
+	)
+	if deleted_id is None:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Type dont found")
 	await session.commit()
 	return {"message": "Type de réception supprimé avec succès"}
\ No newline at end of file
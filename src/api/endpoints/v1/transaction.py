@@ -4,10 +4,12 @@ from uuid import UUID
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
-from fastapi import APIRouter, Query, status, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, Query, status, HTTPException, Depends, BackgroundTasks, Response
 
+from sqlalchemy import bindparam, exists, func, tuple_
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import select
 
 from src.auth.dependances import get_current_user
@@ -17,9 +19,10 @@ from src.db.models import (
     Country, ExchangeRates, Fee, PaymentType, ReceivingType, 
     Transaction, TransactionStatus, User
 )
-from src.db.session import get_session
+from src.db.session import get_read_session, get_session
+from src.services.reference_cache import MISSING, FeeSnapshot, RateSnapshot, fee_by_route, rate_by_pair
 from src.schemas.transaction import (
-    TransactionRead, TransactionCreate, TransactionUpdate, TransferCalculation, 
+    BreakdownView, TransactionRead, TransactionCreate, TransactionUpdate, TransferCalculation, 
     TransferEstimateRequest, TransferEstimateResponse, 
     TransferLimits, TransferMethodsResponse, 
     TransferPreviewRequest, TransferPreviewResponse, 
@@ -38,6 +41,33 @@ DEFAULT_SCALE = Decimal("0.01")
 QUOTE_EXPIRY_MINUTES = 30
 DEFAULT_ESTIMATED_FEE = Decimal("5.0")
 
+# Lookups run on every quote/preview; build them once and bind the ids per call
+_COUNTRY_METHODS_OPTIONS = (
+    joinedload(Country.currency),
+    selectinload(Country.payment_types),
+    selectinload(Country.receiving_types),
+    raiseload("*"),
+)
+
+_COUNTRY_WITH_METHODS = select(Country).options(
+    *_COUNTRY_METHODS_OPTIONS
+).where(Country.id == bindparam("country_id"))
+
+_COUNTRIES_WITH_METHODS = select(Country).options(
+    *_COUNTRY_METHODS_OPTIONS
+).where(Country.id.in_(bindparam("country_ids", expanding=True)))
+
+_EXCHANGE_RATE_BY_PAIR = select(
+    ExchangeRates.id, ExchangeRates.from_currency_id, ExchangeRates.to_currency_id, ExchangeRates.rate
+).where(
+    ExchangeRates.from_currency_id == bindparam("from_currency_id"),
+    ExchangeRates.to_currency_id == bindparam("to_currency_id")
+)
+
+_FEE_BY_ROUTE = select(Fee.id, Fee.fee).where(
+    Fee.from_country_id == bindparam("from_country_id"),
+    Fee.to_country_id == bindparam("to_country_id")
+)
 
 # =============================================================================
 # UTILITY FUNCTIONS - DATABASE
@@ -60,13 +90,7 @@ async def get_country_with_methods(
     Raises:
         HTTPException: Si le pays n'existe pas
     """
-    stmt = select(Country).options(
-        selectinload(Country.currency),
-        selectinload(Country.payment_types),
-        selectinload(Country.receiving_types)
-    ).where(Country.id == country_id)
-    
-    result = await session.execute(stmt)
+    result = await session.execute(_COUNTRY_WITH_METHODS, {"country_id": country_id})
     country = result.scalar_one_or_none()
     
     if not country:
@@ -78,11 +102,47 @@ async def get_country_with_methods(
     return country
 
 
+async def get_route_countries(
+    from_country_id: UUID,
+    to_country_id: UUID,
+    session: AsyncSession
+) -> Tuple[Country, Country]:
+    """
+    Récupère les pays source et destination d'une route en une seule requête
+    
+    Args:
+        from_country_id: ID du pays source
+        to_country_id: ID du pays destination
+        session: Session de base de données
+        
+    Returns:
+        Tuple[Country, Country]: Pays source et destination avec relations chargées
+        
+    Raises:
+        HTTPException: Si l'un des pays n'existe pas
+    """
+    result = await session.execute(
+        _COUNTRIES_WITH_METHODS,
+        {"country_ids": [from_country_id, to_country_id]}
+    )
+    countries = {country.id: country for country in result.scalars()}
+    
+    for country_id in (from_country_id, to_country_id):
+        if country_id not in countries:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Pays avec l'ID {country_id} non trouvé"
+            )
+    
+    return countries[from_country_id], countries[to_country_id]
+
+
 async def get_exchange_rate(
     from_currency_id: UUID,
     to_currency_id: UUID,
-    session: AsyncSession
-) -> ExchangeRates:
+    session: AsyncSession,
+    use_cache: bool = True
+) -> RateSnapshot:
     """
     Récupère le taux de change entre deux devises
     
@@ -90,30 +150,40 @@ async def get_exchange_rate(
         from_currency_id: ID de la devise source
         to_currency_id: ID de la devise destination
         session: Session de base de données
+        use_cache: False pour lire le taux en base (montants réellement facturés)
         
     Returns:
-        ExchangeRates: Taux de change
+        RateSnapshot: Taux de change
         
     Raises:
         HTTPException: Si le taux n'existe pas
     """
-    stmt = select(ExchangeRates).options(
-        selectinload(ExchangeRates.from_currency),
-        selectinload(ExchangeRates.to_currency)
-    ).where(
-        ExchangeRates.from_currency_id == from_currency_id,
-        ExchangeRates.to_currency_id == to_currency_id
-    )
+    # Repeated quotes on a corridor skip the lookup; a missing rate still 404s from the DB
+    pair = (from_currency_id, to_currency_id)
+    if use_cache:
+        rate = rate_by_pair.get(pair)
+        if rate is not None:
+            return rate
     
-    result = await session.execute(stmt)
-    rate = result.scalar_one_or_none()
+    result = await session.execute(
+        _EXCHANGE_RATE_BY_PAIR,
+        {"from_currency_id": from_currency_id, "to_currency_id": to_currency_id}
+    )
+    row = result.one_or_none()
     
-    if not rate:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Taux de change non trouvé pour cette paire de devises"
         )
     
+    rate = RateSnapshot(
+        id=row.id,
+        from_currency_id=row.from_currency_id,
+        to_currency_id=row.to_currency_id,
+        rate=row.rate,
+    )
+    rate_by_pair[pair] = rate
     return rate
 
 
@@ -121,8 +191,9 @@ async def get_fee(
     from_country_id: UUID,
     to_country_id: UUID,
     amount: Decimal,
-    session: AsyncSession
-) -> Optional[Fee]:
+    session: AsyncSession,
+    use_cache: bool = True
+) -> Optional[FeeSnapshot]:
     """
     Récupère les frais applicables pour un transfert
     
@@ -131,18 +202,26 @@ async def get_fee(
         to_country_id: ID du pays destination
         amount: Montant du transfert
         session: Session de base de données
+        use_cache: False pour lire les frais en base (montants réellement facturés)
         
     Returns:
-        Optional[Fee]: Frais applicables ou None
+        Optional[FeeSnapshot]: Frais applicables ou None
     """
-    stmt = select(Fee).where(
-        Fee.from_country_id == from_country_id,
-        Fee.to_country_id == to_country_id
-    )
+    # Fees change rarely but are read on every quote: cached as plain values per route
+    route = (from_country_id, to_country_id)
+    if use_cache:
+        fee = fee_by_route.get(route, MISSING)
+        if fee is not MISSING:
+            return fee
     
-    result = await session.execute(stmt)
-    fee = result.scalar_one_or_none()
+    result = await session.execute(
+        _FEE_BY_ROUTE,
+        {"from_country_id": from_country_id, "to_country_id": to_country_id}
+    )
+    row = result.one_or_none()
+    fee = FeeSnapshot(id=row.id, fee=row.fee) if row else None
     
+    fee_by_route[route] = fee
     return fee
 
 
@@ -240,7 +319,7 @@ async def get_transaction_or_404(
         HTTPException: Si la transaction n'existe pas
     """
     stmt = select(Transaction).options(
-        selectinload(Transaction.sender)
+        joinedload(Transaction.sender)
     ).where(Transaction.id == transaction_id)
     
     result = await session.execute(stmt)
@@ -332,7 +411,7 @@ def create_breakdown(
     from_currency_code: str,
     to_currency_code: str,
     include_fee: bool
-) -> dict:
+) -> BreakdownView:
     """
     Crée le détail du transfert pour l'affichage
     
@@ -347,16 +426,16 @@ def create_breakdown(
         include_fee: Si les frais sont inclus
         
     Returns:
-        dict: Détails formatés du transfert
+        BreakdownView: Détails formatés du transfert
     """
-    return {
-        "you_send": f"{float(sender_amount):.2f} {from_currency_code}",
-        "fee": f"{float(fee_value):.2f} {from_currency_code}",
-        "fee_included": include_fee,
-        "total_to_pay": f"{float(total_to_pay):.2f} {from_currency_code}",
-        "exchange_rate": f"1 {from_currency_code} = {float(exchange_rate):.4f} {to_currency_code}",
-        "they_receive": f"{float(receiver_amount):.2f} {to_currency_code}"
-    }
+    return BreakdownView(
+        you_send=f"{float(sender_amount):.2f} {from_currency_code}",
+        fee=f"{float(fee_value):.2f} {from_currency_code}",
+        fee_included=include_fee,
+        total_to_pay=f"{float(total_to_pay):.2f} {from_currency_code}",
+        exchange_rate=f"1 {from_currency_code} = {float(exchange_rate):.4f} {to_currency_code}",
+        they_receive=f"{float(receiver_amount):.2f} {to_currency_code}"
+    )
     
     
 def build_payment_instructions(
@@ -381,7 +460,8 @@ async def perform_transfer_calculation(
     to_country_id: UUID,
     amount: Decimal,
     include_fee: bool,
-    session: AsyncSession
+    session: AsyncSession,
+    use_cache: bool = True
 ) -> TransferCalculation:
     """
     Effectue tous les calculs nécessaires pour un transfert
@@ -392,13 +472,13 @@ async def perform_transfer_calculation(
         amount: Montant du transfert
         include_fee: Si les frais sont inclus
         session: Session de base de données
+        use_cache: False pour lire taux et frais en base plutôt qu'en cache
         
     Returns:
         TransferCalculation: Résultats des calculs
     """
     # Récupérer les pays
-    from_country = await get_country_with_methods(from_country_id, session)
-    to_country = await get_country_with_methods(to_country_id, session)
+    from_country, to_country = await get_route_countries(from_country_id, to_country_id, session)
     
     # Vérifier si l'envoi est autorisé
     if not from_country.can_send:
@@ -411,7 +491,8 @@ async def perform_transfer_calculation(
     rate = await get_exchange_rate(
         from_country.currency_id,
         to_country.currency_id,
-        session
+        session,
+        use_cache=use_cache
     )
     
     # Récupérer les frais
@@ -419,7 +500,8 @@ async def perform_transfer_calculation(
         from_country_id,
         to_country_id,
         amount,
-        session
+        session,
+        use_cache=use_cache
     )
     
     fee_percent = fee.fee if fee else Decimal('0')
@@ -476,8 +558,9 @@ async def create_transaction(
     await session.commit()
     await session.refresh(transaction)
     
-    # Charger les relations
-    await session.refresh(transaction, ["sender"])
+    # L'expéditeur est l'utilisateur courant, déjà chargé par get_current_user :
+    # on le rattache directement au lieu de le recharger via un SELECT
+    set_committed_value(transaction, "sender", sender)
     
     # ✅ AJOUTER : Notifier tous les admins connectés au dashboard
     await ws_manager.notify_all_admins({
@@ -509,27 +592,75 @@ async def create_transaction(
     description="Récupère la liste des transactions avec filtres et pagination"
 )
 async def get_transactions(
+    response: Response,
     status: Optional[TransactionStatus] = Query(None, description="Filtrer par statut"),
     page: int = Query(1, ge=1, description="Numéro de page"),
     limit: int = Query(100, ge=1, le=100, description="Nombre d'éléments par page"),
-    session: AsyncSession = Depends(get_session)
+    after: Optional[UUID] = Query(None, description="Curseur : ID de la dernière transaction de la page précédente"),
+    with_total: bool = Query(False, description="Renvoyer le nombre de résultats dans l'en-tête X-Total-Count"),
+    session: AsyncSession = Depends(get_read_session)
 ):
-    """Liste toutes les transactions avec pagination et filtres optionnels"""
-    stmt = select(Transaction).options(
-        selectinload(Transaction.sender)
-    ).order_by(Transaction.timestamp.desc())
+    """
+    Liste toutes les transactions avec pagination et filtres optionnels
+
+    Avec `after`, la pagination se fait par curseur (keyset) et `page` est ignoré :
+    le coût ne dépend plus de la profondeur de la page. Un curseur inconnu
+    renvoie 400 plutôt qu'une page vide.
+
+    Avec `with_total`, le nombre de lignes correspondant aux filtres est calculé
+    par `count(*) OVER ()` dans la même requête, sans second COUNT. L'en-tête
+    X-Total-Count est toujours présent : si la page est vide (au-delà de la fin,
+    ou filtre sans résultat), un COUNT séparé avec les mêmes filtres le fournit,
+    et il vaut 0 sans requête pour une première page vide.
+    """
+    if with_total:
+        stmt = select(Transaction, func.count().over().label("total"))
+    else:
+        stmt = select(Transaction)
+    stmt = stmt.options(
+        selectinload(Transaction.sender),
+        raiseload("*")
+    ).order_by(Transaction.timestamp.desc(), Transaction.id.desc())
     
     if status:
         stmt = stmt.where(Transaction.status == status)
     
     # Pagination
-    offset = (page - 1) * limit
-    stmt = stmt.offset(offset).limit(limit)
-    
-    results = await session.execute(stmt)
-    transactions = results.scalars().all()
-    
-    return transactions
+    if after is not None:
+        # (timestamp, id) du curseur, résolu dans la même requête
+        cursor = select(Transaction.timestamp, Transaction.id).where(
+            Transaction.id == after
+        ).scalar_subquery()
+        stmt = stmt.where(tuple_(Transaction.timestamp, Transaction.id) < cursor)
+    else:
+        stmt = stmt.offset((page - 1) * limit)
+    stmt = stmt.limit(limit)
+    
+    rows = (await session.execute(stmt)).all()
+    if not rows and after is not None:
+        # Un curseur inexistant compare à NULL et donne aussi une page vide :
+        # ne pas le confondre avec la fin de la liste
+        cursor_exists = await session.scalar(select(exists().where(Transaction.id == after)))
+        if not cursor_exists:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Curseur inconnu : transaction {after} introuvable"
+            )
+    
+    if with_total:
+        if rows:
+            total = rows[0].total
+        elif after is None and page == 1:
+            # Première page vide : aucune ligne ne correspond aux filtres
+            total = 0
+        else:
+            # Page au-delà de la fin : la fenêtre n'a porté sur aucune ligne
+            count_stmt = select(func.count()).select_from(Transaction)
+            if status:
+                count_stmt = count_stmt.where(Transaction.status == status)
+            total = await session.scalar(count_stmt)
+        response.headers["X-Total-Count"] = str(total)
+    return [row.Transaction for row in rows]
 
 
 @router.get(
@@ -558,7 +689,8 @@ async def get_transaction_by_reference(
 ):
     """Récupère une transaction par sa référence unique"""
     stmt = select(Transaction).options(
-        selectinload(Transaction.sender)
+        joinedload(Transaction.sender),
+        raiseload("*")
     ).where(Transaction.reference == reference)
     
     result = await session.execute(stmt)
@@ -667,8 +799,7 @@ async def get_transfer_methods(
         GET /transfer/methods?from_country_id=xxx&to_country_id=yyy
     """
     # Récupérer les deux pays avec leurs méthodes
-    from_country = await get_country_with_methods(from_country_id, session)
-    to_country = await get_country_with_methods(to_country_id, session)
+    from_country, to_country = await get_route_countries(from_country_id, to_country_id, session)
     
     # Vérifier si le transfert est possible
     can_transfer = from_country.can_send
@@ -730,11 +861,8 @@ async def get_transfer_quote(
         }
     """
     # Récupérer les pays
-    from_country = await get_country_with_methods(
+    from_country, to_country = await get_route_countries(
         quote_request.from_country_id,
-        session
-    )
-    to_country = await get_country_with_methods(
         quote_request.to_country_id,
         session
     )
@@ -846,22 +974,21 @@ async def get_transfer_preview(
         )
     
     # Récupérer les pays
-    from_country = await get_country_with_methods(
+    from_country, to_country = await get_route_countries(
         preview_request.from_country_id,
-        session
-    )
-    to_country = await get_country_with_methods(
         preview_request.to_country_id,
         session
     )
     
-    # Effectuer les calculs
+    # Effectuer les calculs : le preview fixe les montants enregistrés par
+    # create_transaction, donc taux et frais sont lus en base, jamais en cache
     calc = await perform_transfer_calculation(
         preview_request.from_country_id,
         preview_request.to_country_id,
         preview_request.amount,
         preview_request.include_fee,
-        session
+        session,
+        use_cache=False
     )
     
     # Récupérer et valider les méthodes
@@ -1,62 +1,57 @@
 from datetime import datetime
-from typing import List
+from typing import List, Union
 
 from fastapi import APIRouter, status, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
+from sqlalchemy import bindparam, exists
+from sqlalchemy.orm import defer
 from sqlmodel import select, or_
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.auth.auth import hash_password, verify_password, create_access_token, create_refresh_token, decode_token
-from src.auth.dependances import get_current_user
+from src.auth.auth import hash_password, verify_and_update_password, create_access_token, create_refresh_token, decode_token
+from src.auth.dependances import get_current_user, invalidate_cached_user
 from src.auth.permission import admin_required
 from src.config import settings
 from src.db.models import User
-from src.db.session import get_session
+from src.db.session import ReadSession, get_session
 from src.email_service import send_email
-from src.schemas.user import UserRead, UserCreate, UserWithToken, UserLogin, UserUpdate, EmailModel
-
-
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from src.schemas.user import USER_LIST_ADAPTER, USER_LIST_ITEM_ADAPTER, UserListItem, UserRead, UserCreate, UserWithToken, UserLogin, UserUpdate, EmailModel
 
 router = APIRouter()
 
 security = HTTPBearer()
 
-smtp_server = "smtp.mailmug.net"
-port = 2525
-login = "3ilpqpzrmlczkvjh"
-password = "059l7cnworh775rb"
-
-sender_mail = "diarra.msa1@gmail.com"
-to_mail = "diarra.msa@gmail.com"
+# Built once: the compiled SQL and asyncpg's prepared statement are reused on every call.
+# LIMIT 1 because at most one row is wanted; the scan stops at the first match
+_GET_BY_PHONE_STMT = select(User).where(User.phone == bindparam("phone")).limit(1)
+_GET_BY_CREDENTIAL_STMT = select(User).where(or_(
+    User.email == bindparam("credential"),
+    User.phone == bindparam("credential")
+)).limit(1)
 
-message = MIMEMultipart("alternative")
-message['From'] = sender_mail
-message["To"] = to_mail
-message["Subject"] = "Subject here"
 
 async def get_user_or_phone(user_phone: str, session: AsyncSession = Depends(get_session)):
-    stmt = select(User).where(User.phone == user_phone)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+    result = await session.execute(_GET_BY_PHONE_STMT, {"phone": user_phone})
+    user = result.scalars().first()
     return user
 
 
 async def authenticate_user(credential: str, password: str, session: AsyncSession = Depends(get_session)):
     # Recherche par email OU téléphone
-    stmt = select(User).where(or_(
-        User.email == credential,
-        User.phone == credential
-    ))
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+    result = await session.execute(_GET_BY_CREDENTIAL_STMT, {"credential": credential})
+    user = result.scalars().first()
 
     if not user:
         return None
-    if not verify_password(password, user.hash_password):
+    # Argon2 is CPU-bound and releases the GIL: keep it off the event loop
+    verified, new_hash = await run_in_threadpool(verify_and_update_password, password, user.hash_password)
+    if not verified:
         return None
+    if new_hash:
+        user.hash_password = new_hash
+        await session.commit()
     return user
 
 
@@ -68,19 +63,25 @@ async def send_mail():
     <h2>Merci pour votre confiance</h2>
     <p>Votre transfert est en cours de traitement.</p>
     """
-    result = send_email(to, subject, html)
+    # resend's client is blocking; keep it off the event loop
+    result = await run_in_threadpool(send_email, to, subject, html)
     return {"status": "sent", "resend_response": result}
 
 @router.post('/sign-up', response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def create_user(user: UserCreate, session: AsyncSession = Depends(get_session)):
-    result = await session.execute(
-        select(User).where(User.phone == user.phone)
-    )
-    existing_user = result.scalar_one_or_none()
-    if existing_user:
+    # Both EXISTS probes in one round-trip; each stops at the first index hit
+    phone_taken, email_taken = (await session.execute(
+        select(
+            exists().where(User.phone == user.phone),
+            exists().where(User.email == user.email),
+        )
+    )).one()
+    if phone_taken:
         raise HTTPException(status_code=400, detail="Phone number already registered")
+    if email_taken:
+        raise HTTPException(status_code=400, detail="Email already registered")
 
-    hashed_password = hash_password(user.password)
+    hashed_password = await run_in_threadpool(hash_password, user.password)
     user_data = User(**user.dict(exclude={'password'}), hash_password=hashed_password)
     session.add(user_data)
     await session.commit()
@@ -120,7 +121,7 @@ async def refresh_token(request: Request):
     refresh_token = body.get("refresh_token")
     if not refresh_token:
         raise HTTPException(status_code=400, detail="Refresh token required")
-    payload = decode_token(refresh_token, settings.REFRESH_SECRET_KEY)
+    payload = await decode_token(refresh_token, settings.REFRESH_SECRET_KEY)
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid refresh token")
     user_id = payload.get("sub")
@@ -134,14 +135,47 @@ async def user_info(current_user = Depends(get_current_user)):
 
 
 
-@router.get("", response_model=List[UserRead], dependencies=[Depends(admin_required)])
-async def get_all_users(
-    session: AsyncSession = Depends(get_session)
-):
-    stmt = select(User).order_by(User.created_at.desc())
-    results = await session.execute(stmt)
-    users = results.scalars().all()
-    return users
+# Server-side cursor in chunks of 500: the full user table is never held in memory.
+# UserRead never renders the password hash, so it is not fetched at all.
+_USER_LIST_STMT = (
+    select(User)
+    .options(defer(User.hash_password, raiseload=True))
+    .order_by(User.created_at.desc())
+    .execution_options(yield_per=500)
+)
+# Only the UserListItem columns: plain rows, no entities
+_USER_LIST_ITEM_STMT = (
+    select(User.id, User.full_name, User.phone, User.email, User.role)
+    .order_by(User.created_at.desc())
+    .execution_options(yield_per=500)
+)
+
+
+async def _stream_users_json(compact: bool = False):
+    adapter = USER_LIST_ITEM_ADAPTER if compact else USER_LIST_ADAPTER
+    async with ReadSession() as session:
+        if compact:
+            users = await session.stream(_USER_LIST_ITEM_STMT)
+        else:
+            users = await session.stream_scalars(_USER_LIST_STMT)
+        yield b"["
+        separator = b""
+        # One validate + dump per chunk instead of per row; [1:-1] drops the chunk's own brackets
+        async for chunk in users.partitions():
+            batch = adapter.validate_python(chunk, from_attributes=True)
+            yield separator + adapter.dump_json(batch)[1:-1]
+            separator = b","
+        yield b"]"
+
+
+@router.get(
+    "",
+    response_model=Union[List[UserRead], List[UserListItem]],
+    dependencies=[Depends(admin_required)]
+)
+async def get_all_users(compact: bool = False):
+    """`compact=true` ne renvoie que id, nom, téléphone, email et rôle"""
+    return StreamingResponse(_stream_users_json(compact), media_type="application/json")
 
 
 @router.patch("/{user_id}", response_model=UserRead)
@@ -154,6 +188,8 @@ async def update_user(
     for key, value in user_data_dict.items():
         setattr(user, key, value)
     await session.commit()
+    # Evicted once committed: a concurrent miss before this point can only cache the old row
+    invalidate_cached_user(user.id)
     await session.refresh(user)
     return user
 
@@ -165,4 +201,5 @@ async def delete_user(
 ):
     await session.delete(user)
     await session.commit()
+    invalidate_cached_user(user.id)
     return {"message": "Votre compte a été supprimé avec success!"}
\ No newline at end of file
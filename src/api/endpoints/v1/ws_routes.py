@@ -8,6 +8,7 @@ import logging
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 from jose import jwt, JWTError
 
+from src.auth.permission import AGENT_OR_ADMIN_ROLES
 from src.config import settings
 from src.core.websocket_manager import ws_manager
 
@@ -23,10 +24,9 @@ def decode_token(token: str) -> dict | None:
         role = payload.get("role", "user")
         if user_id is None:
             return None
-        logger.info(f"🔑 WS token decoded → user_id={user_id}, role={role}")
         return {"user_id": str(user_id), "role": role}
     except JWTError as e:
-        logger.warning(f"❌ WS token invalid: {e}")
+        logger.warning("❌ WS token invalid: %s", e)
         return None
 
 
@@ -57,7 +57,7 @@ async def ws_user_transactions(websocket: WebSocket, token: str = Query(...)):
     except WebSocketDisconnect:
         ws_manager.disconnect_user(user_id, websocket)
     except Exception as e:
-        logger.error(f"WS user error: {e}")
+        logger.error("WS user error: %s", e)
         ws_manager.disconnect_user(user_id, websocket)
 
 
@@ -77,8 +77,8 @@ async def ws_admin(websocket: WebSocket, token: str = Query(...)):
         return
 
     # Vérifier que c'est bien un admin
-    if payload.get("role") not in ("admin", "agent"):
-        logger.warning(f"⛔ WS admin rejected: user_id={payload['user_id']}, role={payload.get('role')}")
+    if payload.get("role") not in AGENT_OR_ADMIN_ROLES:
+        logger.warning("⛔ WS admin rejected: user_id=%s, role=%s", payload['user_id'], payload.get('role'))
         await websocket.close(code=4003, reason="Admin access required")
         return
 
@@ -93,7 +93,7 @@ async def ws_admin(websocket: WebSocket, token: str = Query(...)):
     except WebSocketDisconnect:
         ws_manager.disconnect_admin(admin_id, websocket)
     except Exception as e:
-        logger.error(f"WS admin error: {e}")
+        logger.error("WS admin error: %s", e)
         ws_manager.disconnect_admin(admin_id, websocket)
 
 
@@ -1,5 +1,13 @@
-from datetime import timedelta, datetime
-from jose import jwt, JWTError
+import asyncio
+import functools
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from cachetools import TLRUCache
+from jose import jwk, jwt, JWTError
 from passlib.context import CryptContext
 
 from src.config import settings
@@ -7,7 +15,41 @@ from src.config import settings
 
 ACCESS_TOKEN_EXPIRE_MINUTE = 60 * 24
 REFRESH_TOKEN_EXPIRE_DAYS = 30
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+TOKEN_CACHE_TTL_SECONDS = 60
+_ACCESS_TOKEN_LIFETIME = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTE)
+_REFRESH_TOKEN_LIFETIME = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+# Argon2id at the OWASP baseline (19 MiB, t=2, p=1); older hashes are upgraded on login
+pwd_context = CryptContext(
+	schemes=["argon2"],
+	deprecated="auto",
+	argon2__type="ID",
+	argon2__memory_cost=19456,
+	argon2__time_cost=2,
+	argon2__parallelism=1,
+)
+
+
+def _token_ttu(_key, payload: dict, now: float) -> float:
+	# Never keep a decoded token past its own `exp` claim
+	return min(now + TOKEN_CACHE_TTL_SECONDS, payload.get('exp', now))
+
+
+# Keyed by (secret, sha256(token)) so raw bearer tokens are never kept in memory
+_token_cache: TLRUCache = TLRUCache(maxsize=10000, ttu=_token_ttu, timer=time.time)
+
+# RSA/ECDSA verification releases the GIL, so threads keep it off the event loop
+_jwt_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='jwt')
+
+@functools.lru_cache(maxsize=None)
+def _signing_key(secret_key: str):
+	# Parse the key material once instead of on every encode/decode
+	return jwk.construct(secret_key, settings.ALGORITHM)
+
+
+@functools.lru_cache(maxsize=None)
+def _verify_key(secret_key: str):
+	key = _signing_key(secret_key)
+	return key if settings.ALGORITHM.startswith('HS') else key.public_key()
 
 def hash_password(password: str):
 	return pwd_context.hash(password)
@@ -15,22 +57,40 @@ def hash_password(password: str):
 def verify_password(plain, hashed_password):
 	return pwd_context.verify(plain, hashed_password)
 
+def verify_and_update_password(plain, hashed_password) -> tuple[bool, str | None]:
+	# Second item is a fresh hash when the stored one uses outdated parameters
+	return pwd_context.verify_and_update(plain, hashed_password)
+
 def create_token(data: dict, expires_delta: timedelta, secret_key: str):
-	to_encode = data.copy()
-	expire = datetime.utcnow() + expires_delta
-	to_encode.update({'exp': expire})
-	return jwt.encode(to_encode, secret_key, algorithm=settings.ALGORITHM)
+	# Integer `exp` skips the datetime -> timestamp conversion in jose
+	to_encode = {**data, 'exp': int(time.time()) + int(expires_delta.total_seconds())}
+	return jwt.encode(to_encode, _signing_key(secret_key), algorithm=settings.ALGORITHM)
 
 def create_access_token(data: dict) -> str:
-	return create_token(data, timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTE), settings.SECRET_KEY)
+	return create_token(data, _ACCESS_TOKEN_LIFETIME, settings.SECRET_KEY)
 
 def create_refresh_token(data: dict) -> str:
-	return create_token(data, timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS), secret_key=settings.REFRESH_SECRET_KEY)
+	return create_token(data, _REFRESH_TOKEN_LIFETIME, secret_key=settings.REFRESH_SECRET_KEY)
 
-def decode_token(token: str, secret_key: str) -> dict | None:
+def _decode_uncached(token: str, secret_key: str) -> dict | None:
 	try:
-		payload = jwt.decode(token, secret_key, algorithms=[settings.ALGORITHM])
-		return payload
+		return jwt.decode(token, _verify_key(secret_key), algorithms=[settings.ALGORITHM])
 	except JWTError:
 		return None
 
+async def decode_token(token: str, secret_key: str) -> dict | None:
+	key = (secret_key, hashlib.sha256(token.encode()).hexdigest())
+	payload = _token_cache.get(key)
+	if payload is not None:
+		return payload
+	if settings.ALGORITHM.startswith('HS'):
+		# HMAC is cheaper than the thread hop
+		payload = _decode_uncached(token, secret_key)
+	else:
+		payload = await asyncio.get_running_loop().run_in_executor(
+			_jwt_executor, _decode_uncached, token, secret_key
+		)
+	if payload is None:
+		return None
+	_token_cache[key] = payload
+	return payload
@@ -1,5 +1,12 @@
+import asyncio
+import re
+from types import MappingProxyType
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import bindparam, inspect
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -10,25 +17,98 @@ from src.db.session import get_session
 
 security  = HTTPBearer()
 
+_WWW_AUTH = {"WWW-Authenticate": "Bearer"}
+_UUID_RE = re.compile(r'\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z', re.I)
+
+# Short-lived cache of authenticated users, keyed by the token `sub`.
+# Holds read-only column snapshots, never a session's User instance
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+# Same for the (id, role) rows used by the permission checks
+_principal_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+# Lookups in flight per `sub`: concurrent cache misses for one user share a single SELECT
+_user_inflight: dict[str, asyncio.Future] = {}
+
+
+# Built once; only the bound id changes between requests
+_USER_BY_ID = select(User).where(User.id == bindparam("uid"))
+_PRINCIPAL_BY_ID = select(User.id, User.role).where(User.id == bindparam("uid"))
+
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+def _snapshot(user: User) -> MappingProxyType:
+	return MappingProxyType({key: getattr(user, key) for key in _USER_COLUMNS})
+
+def _detached_user(snapshot) -> User:
+	# A fresh instance per request, so handlers may mutate it freely
+	user = User(**snapshot)
+	make_transient_to_detached(user)
+	return user
+
+
+def invalidate_cached_user(user_id) -> None:
+	_user_cache.pop(str(user_id), None)
+	_principal_cache.pop(str(user_id), None)
+
 async def get_user_or_id(user_id: str, session: AsyncSession = Depends(get_session)):
-	stmt = select(User).where(User.id == user_id)
-	result = await session.execute(stmt)
+	result = await session.execute(_USER_BY_ID, {"uid": user_id})
 	return result.scalar_one_or_none()
 
+async def _token_subject(credentials: HTTPAuthorizationCredentials) -> str:
+	payload = await decode_token(credentials.credentials, settings.SECRET_KEY)
+	user_id = payload.get("sub") if payload else None
+	# Cheap shape check on `sub`; it stays a str for the lookup below
+	if not user_id or not _UUID_RE.match(user_id):
+		raise HTTPException(status_code=401, detail="Invalid token", headers=_WWW_AUTH)
+	return user_id
+
 async def get_current_user(
 		credentials: HTTPAuthorizationCredentials = Security(security),
 		session: AsyncSession = Depends(get_session)
 ):
-	token = credentials.credentials
-	payload = decode_token(token, settings.SECRET_KEY)
-	if not payload:
-		raise HTTPException(status_code=401, detail="Invalid token")
+	user_id = await _token_subject(credentials)
 
-	user_id = payload.get("sub")
+	cached = _user_cache.get(user_id)
+	if cached is None and user_id in _user_inflight:
+		# Shielded so a cancelled waiter cannot cancel the shared lookup
+		cached = await asyncio.shield(_user_inflight[user_id])
+	if cached is not None:
+		# Attach a copy of the snapshot to this request's session without a SELECT
+		return await session.merge(_detached_user(cached), load=False)
 
-	user = await get_user_or_id(user_id=user_id, session=session)
+	pending = asyncio.get_running_loop().create_future()
+	_user_inflight[user_id] = pending
+	snapshot = None
+	try:
+		user = await get_user_or_id(user_id=user_id, session=session)
+		if user:
+			snapshot = _snapshot(user)
+	finally:
+		del _user_inflight[user_id]
+		# Waiters get the snapshot, never this session's User; None on a miss
+		# or an error, and they then run their own lookup
+		pending.set_result(snapshot)
 
 	if not user:
 		raise HTTPException(status_code=404, detail="User not found")
+	_user_cache[user_id] = snapshot
 	return user
 
+
+async def get_current_principal(
+		credentials: HTTPAuthorizationCredentials = Security(security),
+		session: AsyncSession = Depends(get_session)
+):
+	# Only `id` and `role`: role checks never need the rest of the row
+	user_id = await _token_subject(credentials)
+
+	principal = _principal_cache.get(user_id)
+	if principal is not None:
+		return principal
+
+	result = await session.execute(_PRINCIPAL_BY_ID, {"uid": user_id})
+	principal = result.first()
+	if not principal:
+		raise HTTPException(status_code=404, detail="User not found")
+	_principal_cache[user_id] = principal
+	return principal
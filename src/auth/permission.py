@@ -1,16 +1,19 @@
 from fastapi import Depends, HTTPException, status
 
-from src.auth.dependances import get_current_user
-from src.db.models import User
-from src.schemas.user import UserRole
+from src.auth.dependances import get_current_principal
+from src.db.models import UserRole
 
+# `users.role` is the native user_role enum, so rows come back as UserRole members
+ADMIN_ROLES = frozenset({UserRole.ADMIN})
+AGENT_OR_ADMIN_ROLES = frozenset({UserRole.ADMIN, UserRole.AGENT})
 
-async def admin_required(current_user: User = Depends(get_current_user)):
-    if current_user.role != UserRole.ADMIN:
+
+async def admin_required(current_user = Depends(get_current_principal)):
+    if current_user.role not in ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="Permission denied")
     return current_user
 
-async def agent_or_admin_required(current_user: User = Depends(get_current_user)):
-    if current_user.role not in [UserRole.ADMIN, UserRole.AGENT]:
+async def agent_or_admin_required(current_user = Depends(get_current_principal)):
+    if current_user.role not in AGENT_OR_ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="Permission denied")
     return current_user
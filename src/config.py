@@ -9,6 +9,7 @@ class Settings(BaseSettings):
 	APP_ENV: str
 	APP_DEBUG: bool
 	DATABASE_URL: str
+	DATABASE_REPLICA_URL: str | None = None
 	MAIL_USERNAME: str
 	MAIL_PASSWORD: str
 	MAIL_FROM: str
@@ -24,6 +25,10 @@ class Settings(BaseSettings):
 	ALGORITHM: str
 	REFRESH_SECRET_KEY:str
 	REDIS_URL: str = "redis://localhost:6379/0"
+	DB_POOL_SIZE: int = 10
+	DB_MAX_OVERFLOW: int = 20
+	DB_POOL_TIMEOUT: int = 10
+	DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
 
 	POSTGRES_DB: str
 	POSTGRES_USER: str
@@ -38,6 +43,9 @@ class Settings(BaseSettings):
 	def active_database_url(self):
 		return self.DATABASE_URL
 
+	def replica_database_url(self):
+		return self.DATABASE_REPLICA_URL or self.DATABASE_URL
+
 
 settings = Settings()
 
@@ -59,7 +67,7 @@ def decode_url_safe_token(token: str):
 		token_data = serializer.loads(token)
 		return token_data
 	except Exception as e:
-		logging.error(str(e))
+		logging.error("%s", e)
 		return None
 
 
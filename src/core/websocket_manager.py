@@ -19,6 +19,9 @@ class ConnectionManager:
         self.user_connections: Dict[str, List[WebSocket]] = {}
         # Connexions admins: { admin_id: [WebSocket, ...] }
         self.admin_connections: Dict[str, List[WebSocket]] = {}
+        # Compteurs maintenus à chaque (dé)connexion pour éviter un scan O(n)
+        self._user_total = 0
+        self._admin_total = 0
 
     # ==========================================
     # USER CONNECTIONS
@@ -29,21 +32,24 @@ class ConnectionManager:
         if user_id not in self.user_connections:
             self.user_connections[user_id] = []
         self.user_connections[user_id].append(websocket)
+        self._user_total += 1
         logger.info(
-            f"✅ WS user connected: user_id={user_id} "
-            f"(total user connections: {self._count_user_connections()})"
+            "✅ WS user connected: user_id=%s (total user connections: %d)",
+            user_id, self._user_total,
         )
 
     def disconnect_user(self, user_id: str, websocket: WebSocket):
         if user_id in self.user_connections:
+            before = len(self.user_connections[user_id])
             self.user_connections[user_id] = [
                 ws for ws in self.user_connections[user_id] if ws != websocket
             ]
+            self._user_total -= before - len(self.user_connections[user_id])
             if not self.user_connections[user_id]:
                 del self.user_connections[user_id]
         logger.info(
-            f"🔌 WS user disconnected: user_id={user_id} "
-            f"(remaining: {self._count_user_connections()})"
+            "🔌 WS user disconnected: user_id=%s (remaining: %d)",
+            user_id, self._user_total,
         )
 
     async def notify_user(self, user_id: str, data: dict):
@@ -52,19 +58,20 @@ class ConnectionManager:
         connections = self.user_connections.get(user_id_str, [])
 
         if not connections:
-            logger.warning(
-                f"📤 notify_user: user_id='{user_id_str}' NOT connected. "
-                f"Connected users: {list(self.user_connections.keys())}"
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "📤 notify_user: user_id='%s' NOT connected. Connected users: %s",
+                    user_id_str, list(self.user_connections),
+                )
             return
 
-        logger.info(f"📤 notify_user: sending to user_id='{user_id_str}' ({len(connections)} conn)")
+        logger.info("📤 notify_user: sending to user_id='%s' (%d conn)", user_id_str, len(connections))
         dead = []
         for ws in connections:
             try:
                 await ws.send_json(data)
             except Exception as e:
-                logger.error(f"Failed to send to user {user_id_str}: {e}")
+                logger.error("Failed to send to user %s: %s", user_id_str, e)
                 dead.append(ws)
 
         for ws in dead:
@@ -79,21 +86,24 @@ class ConnectionManager:
         if admin_id not in self.admin_connections:
             self.admin_connections[admin_id] = []
         self.admin_connections[admin_id].append(websocket)
+        self._admin_total += 1
         logger.info(
-            f"✅ WS admin connected: admin_id={admin_id} "
-            f"(total admin connections: {self._count_admin_connections()})"
+            "✅ WS admin connected: admin_id=%s (total admin connections: %d)",
+            admin_id, self._admin_total,
         )
 
     def disconnect_admin(self, admin_id: str, websocket: WebSocket):
         if admin_id in self.admin_connections:
+            before = len(self.admin_connections[admin_id])
             self.admin_connections[admin_id] = [
                 ws for ws in self.admin_connections[admin_id] if ws != websocket
             ]
+            self._admin_total -= before - len(self.admin_connections[admin_id])
             if not self.admin_connections[admin_id]:
                 del self.admin_connections[admin_id]
         logger.info(
-            f"🔌 WS admin disconnected: admin_id={admin_id} "
-            f"(remaining: {self._count_admin_connections()})"
+            "🔌 WS admin disconnected: admin_id=%s (remaining: %d)",
+            admin_id, self._admin_total,
         )
 
     async def notify_all_admins(self, data: dict):
@@ -103,7 +113,7 @@ class ConnectionManager:
             return
 
         total = self._count_admin_connections()
-        logger.info(f"📤 notify_all_admins: broadcasting to {total} admin connection(s)")
+        logger.info("📤 notify_all_admins: broadcasting to %d admin connection(s)", total)
 
         dead_pairs = []
         for admin_id, connections in self.admin_connections.items():
@@ -111,7 +121,7 @@ class ConnectionManager:
                 try:
                     await ws.send_json(data)
                 except Exception as e:
-                    logger.error(f"Failed to send to admin {admin_id}: {e}")
+                    logger.error("Failed to send to admin %s: %s", admin_id, e)
                     dead_pairs.append((admin_id, ws))
 
         for admin_id, ws in dead_pairs:
@@ -136,10 +146,10 @@ class ConnectionManager:
         }
 
     def _count_user_connections(self) -> int:
-        return sum(len(conns) for conns in self.user_connections.values())
+        return self._user_total
 
     def _count_admin_connections(self) -> int:
-        return sum(len(conns) for conns in self.admin_connections.values())
+        return self._admin_total
 
 
 # Singleton global
@@ -1,17 +1,36 @@
 import enum
+import os
+import time
 import uuid
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import Index, UniqueConstraint, func, text, Enum as PgEnum
+from sqlalchemy import Index, Sequence, UniqueConstraint, func, text, Enum as PgEnum
 
 from sqlmodel import SQLModel, Field, Column, DECIMAL, Relationship
 import sqlalchemy.dialects.postgresql as pg
 
 
 
+def _uuid7() -> uuid.UUID:
+    # RFC 9562 layout: 48-bit Unix ms timestamp, version 7, variant 10, 74 random bits
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62 & 0xFFF) << 64
+        | 0b10 << 62
+        | rand & ((1 << 62) - 1)
+    )
+    return uuid.UUID(int=value)
+
+
+# Time-ordered ids keep inserts on the right-hand edge of the primary key btree
+uuid7 = getattr(uuid, 'uuid7', _uuid7)
+
+
 class UserRole(str, Enum):
     ADMIN = 'admin'
     USER = 'user'
@@ -21,7 +40,7 @@ class UserRole(str, Enum):
 class User(SQLModel, table=True):
     __tablename__ = "users"
 
-    id: uuid.UUID = Field(sa_column=Column(pg.UUID, primary_key=True, default=uuid.uuid4))
+    id: uuid.UUID = Field(sa_column=Column(pg.UUID, primary_key=True, default=uuid7))
     full_name: str = Field(sa_column=Column(pg.VARCHAR))
     phone: str = Field(sa_column=Column(pg.VARCHAR, unique=True))
     email: str = Field(sa_column=Column(pg.VARCHAR, unique=True))
@@ -30,14 +49,18 @@ class User(SQLModel, table=True):
 
     hash_password: str = Field(sa_column=Column(pg.VARCHAR, nullable=False), exclude=True)
 
-    role: UserRole = Field(default=UserRole.USER, sa_column=Column(pg.VARCHAR, nullable=False))
+    role: UserRole = Field(
+        default=UserRole.USER,
+        sa_column=Column(
+            # Native enum storing the lower-case values ('admin', ...), not the member names
+            PgEnum(UserRole, name="user_role", create_type=False, values_callable=lambda roles: [r.value for r in roles]),
+            nullable=False,
+        )
+    )
     profile_picture_url: Optional[str] = Field(sa_column=Column(pg.VARCHAR, nullable=True))
 
-    token: "FCMToken" = Relationship(back_populates='user', cascade_delete=True)
-
-    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column=Column(pg.TIMESTAMP(timezone=True), default=datetime.utcnow))
-    updated_at: datetime = Field(default_factory=datetime.utcnow,
-                                 sa_column=Column(pg.TIMESTAMP(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow))
+    created_at: datetime = Field(sa_column=Column(pg.TIMESTAMP(timezone=True), server_default=func.now()))
+    updated_at: datetime = Field(sa_column=Column(pg.TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()))
 
     token: "FCMToken" = Relationship(back_populates='user', cascade_delete=True)
     # Transactions envoyées
@@ -52,6 +75,10 @@ class User(SQLModel, table=True):
         sa_relationship_kwargs={"foreign_keys": "[Transaction.processed_by_admin_id]"},
     )
 
+    def __repr__(self) -> str:
+        # Short form: the default repr walks every field, password hash included
+        return f"User(id={self.id}, role={self.role})"
+
 
 class Currency(SQLModel, table=True):
     __tablename__ = "currencies"
@@ -65,6 +92,10 @@ class Currency(SQLModel, table=True):
 
 class Country(SQLModel, table=True):
     __tablename__ = 'countries'
+    __table_args__ = (
+        Index('idx_country_currency_id', 'currency_id'),
+        Index('idx_country_can_send', 'can_send', postgresql_where=text('can_send')),
+    )
     id:uuid.UUID = Field(sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4))
     name: str = Field(sa_column=Column(pg.VARCHAR, nullable=False, unique=True))
     code_iso: str = Field(sa_column=Column(pg.VARCHAR(2), nullable=False, unique=True))
@@ -129,15 +160,21 @@ class TransactionStatus(str, Enum):
 
 
 
-def generate_reference():
-    return f"tx{uuid.uuid4().hex[:10].lower()}"
+# Sequence-backed references never collide, and the unique index grows append-only.
+# Uppercase prefix keeps them disjoint from the legacy random "tx<hex>" values.
+transaction_ref_seq = Sequence("transaction_ref_seq", metadata=SQLModel.metadata)
 
 class Transaction(SQLModel, table=True):
     __tablename__ = "transactions"
-    __table_args__ = (Index("idx_transaction_status", "status"), )
+    __table_args__ = (
+        Index("idx_transaction_sender_created", "sender_id", "created_at"),
+        # Match the list ordering (timestamp DESC, id DESC), with and without a status filter
+        Index("idx_transaction_timestamp_id", "timestamp", "id"),
+        Index("idx_transaction_status_timestamp", "status", "timestamp", "id"),
+    )
 
-    id: uuid.UUID = Field(sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4))
-    timestamp: datetime = Field(sa_column=Column(pg.TIMESTAMP(timezone=True), default=datetime.now))
+    id: uuid.UUID = Field(sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid7))
+    timestamp: datetime = Field(sa_column=Column(pg.TIMESTAMP(timezone=True), server_default=func.now()))
     
     created_at: datetime = Field(
         sa_column=Column(
@@ -155,7 +192,14 @@ class Transaction(SQLModel, table=True):
             onupdate=func.now(),
         )
     )
-    reference: str = Field(sa_column=Column(pg.VARCHAR(12), unique=True), default_factory=generate_reference)
+    reference: str = Field(
+        sa_column=Column(
+            pg.VARCHAR(12),
+            unique=True,
+            nullable=False,
+            server_default=text("'TX' || lpad(nextval('transaction_ref_seq')::text, 10, '0')"),
+        )
+    )
     sender_id: uuid.UUID = Field(foreign_key="users.id")
     sender_country: str = Field(sa_column=Column(pg.VARCHAR(50), nullable=False))
     sender_currency: str = Field(sa_column=Column(pg.VARCHAR(10), nullable=False))
@@ -210,12 +254,15 @@ class Transaction(SQLModel, table=True):
         sa_relationship_kwargs={"foreign_keys": "[Transaction.processed_by_admin_id]"},
     )
 
+    def __repr__(self) -> str:
+        return f"Transaction(id={self.id}, reference={self.reference}, status={self.status})"
+
 
 class Fee(SQLModel, table=True):
     __tablename__ = 'fees'
     __table_args__ = (Index('idx_from_to', 'from_country_id', 'to_country_id'),)
 
-    id: uuid.UUID = Field(sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4))
+    id: uuid.UUID = Field(sa_column=Column(pg.UUID, nullable=False, primary_key=True, server_default=func.gen_random_uuid()))
     from_country_id: uuid.UUID = Field(foreign_key='countries.id', nullable=False, ondelete='CASCADE')
     to_country_id: uuid.UUID = Field(foreign_key='countries.id', nullable=False, ondelete='CASCADE')
     fee: Decimal = Field(sa_column=Column(DECIMAL(precision=10, scale=2), nullable=False))
@@ -223,7 +270,6 @@ class Fee(SQLModel, table=True):
     # TIMESTAMPS
     # =========================
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
         sa_column=Column(
             pg.TIMESTAMP(timezone=True),
             nullable=False,
@@ -232,12 +278,11 @@ class Fee(SQLModel, table=True):
     )
 
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
         sa_column=Column(
             pg.TIMESTAMP(timezone=True),
             nullable=False,
             server_default=text("now()"),
-            onupdate=datetime.utcnow
+            onupdate=func.now()
         )
     )
 
@@ -245,7 +290,7 @@ class Fee(SQLModel, table=True):
 class FCMToken(SQLModel, table=True):
     __tablename__ = "fcm_tokens"
 
-    pk: uuid.UUID = Field(sa_column=Column(pg.UUID, primary_key=True, default=uuid.uuid4))
+    pk: uuid.UUID = Field(sa_column=Column(pg.UUID, primary_key=True, default=uuid7))
     token: str = Field(sa_column=Column(pg.VARCHAR, nullable=False, unique=True))
     user_id: uuid.UUID = Field(foreign_key='users.id')
 
@@ -272,7 +317,7 @@ class TransactionStatusHistory(SQLModel, table=True):
     __tablename__ = "transaction_status_history"
 
     id: uuid.UUID = Field(
-        sa_column=Column(pg.UUID, primary_key=True, default=uuid.uuid4)
+        sa_column=Column(pg.UUID, primary_key=True, default=uuid7)
     )
 
     transaction_id: uuid.UUID = Field(
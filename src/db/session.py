@@ -1,18 +1,60 @@
+import asyncio
 from collections.abc import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from src.config import settings
 
-engine = AsyncEngine(create_engine(url=settings.active_database_url()))
+# Larger compiled-statement cache than the default 500: every router builds its own selects
+engine = create_async_engine(
+	url=settings.active_database_url(),
+	query_cache_size=2000,
+	pool_size=settings.DB_POOL_SIZE,
+	max_overflow=settings.DB_MAX_OVERFLOW,
+	pool_timeout=settings.DB_POOL_TIMEOUT,
+	pool_pre_ping=True,
+	# asyncpg keeps prepared statements per connection; the default of 100 is evicted by our query mix
+	connect_args={'prepared_statement_cache_size': settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+)
 Session = async_sessionmaker(
 	bind=engine,
 	class_=AsyncSession,
 	expire_on_commit=False
 )
 
+# Scan-heavy listings that tolerate replication lag; falls back to the primary when no replica is configured
+if settings.DATABASE_REPLICA_URL:
+	replica_engine = create_async_engine(
+		url=settings.replica_database_url(),
+		query_cache_size=2000,
+		pool_size=settings.DB_POOL_SIZE,
+		max_overflow=settings.DB_MAX_OVERFLOW,
+		pool_timeout=settings.DB_POOL_TIMEOUT,
+		pool_pre_ping=True,
+		connect_args={'prepared_statement_cache_size': settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+	)
+else:
+	replica_engine = engine
+ReadSession = async_sessionmaker(
+	bind=replica_engine,
+	class_=AsyncSession,
+	expire_on_commit=False
+)
+
 async def get_session() -> AsyncGenerator:
 	async with Session() as session:
 		yield session
+
+async def get_read_session() -> AsyncGenerator:
+	async with ReadSession() as session:
+		yield session
+
+async def _open_connection() -> None:
+	async with engine.connect() as conn:
+		await conn.execute(text("SELECT 1"))
+
+async def warm_up_pool() -> None:
+	# Open pool_size connections up front so the first burst of requests skips the handshakes
+	await asyncio.gather(*(_open_connection() for _ in range(settings.DB_POOL_SIZE)))
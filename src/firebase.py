@@ -1,16 +1,28 @@
+import functools
 import os
-import firebase_admin
-from firebase_admin import credentials, messaging
-
 
 current_dir = os.path.dirname(__file__)
 service_account_path = os.path.abspath(
     os.path.join(current_dir, '..', 'service.json')
 )
 
-if not firebase_admin._apps:
+
+@functools.lru_cache(maxsize=1)
+def _get_app():
+    # Initialised on first push so workers that never notify skip the SDK
+    import firebase_admin
+    from firebase_admin import credentials
+
+    if firebase_admin._apps:
+        return firebase_admin.get_app()
     cred = credentials.Certificate(service_account_path)
-    firebase_admin.initialize_app(cred)
+    return firebase_admin.initialize_app(cred)
+
+
+def send_message(message, dry_run: bool = False) -> str:
+    from firebase_admin import messaging
+
+    return messaging.send(message, dry_run=dry_run, app=_get_app())
 
 
-__all__ = ["messaging"]
+__all__ = ["send_message"]
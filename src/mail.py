@@ -1,19 +1,9 @@
 from fastapi_mail import  ConnectionConfig, MessageSchema, FastMail, MessageType
 from pydantic import EmailStr
 
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-
 from src.config import settings
 
 
-smtp_server = "smtp.mailmug.net"
-port = 2525
-login = "3ilpqpzrmlczkvjh"
-password = "059l7cnworh775rb"
-
-
 mail_conf = ConnectionConfig(
     MAIL_USERNAME = settings.MAIL_USERNAME,
     MAIL_PASSWORD = settings.MAIL_PASSWORD,
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, ConfigDict, PlainSerializer
+
+
+class BaseSchema(BaseModel):
+    """Shared base for schemas read straight from ORM rows."""
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Numeric fields rendered as JSON floats: pydantic-core calls the float builtin
+# directly instead of going through a @field_serializer method
+AsFloat = PlainSerializer(float, return_type=float)
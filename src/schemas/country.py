@@ -1,7 +1,7 @@
 from decimal import Decimal
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from datetime import datetime
-from pydantic import BaseModel, field_validator, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from uuid import UUID
 
 from src.schemas.currency import CurrencyModel
@@ -12,15 +12,13 @@ from src.schemas.rtype import ReceivingTypeRead
 # COUNTRY SCHEMAS
 # ============================================
 
+# Stripped and upper-cased by pydantic-core before the length check
+CountryCode = Annotated[str, StringConstraints(strip_whitespace=True, to_upper=True, min_length=2, max_length=3)]
+
 class CountryBase(BaseModel):
     name: str = Field(..., min_length=2, max_length=100)
-    code_iso: str = Field(..., min_length=2, max_length=3, description="ISO country code (e.g., US, FR)")
+    code_iso: CountryCode = Field(..., description="ISO country code (e.g., US, FR)")
     can_send: Optional[bool] = Field(default=True, description="Indicates if sending is allowed from this country")
-    
-    @field_validator('code_iso')
-    @classmethod
-    def validate_code_iso(cls, v):
-        return v.upper().strip()
 
 
 class CountryCreate(CountryBase):
@@ -31,16 +29,9 @@ class CountryCreate(CountryBase):
 class CountryUpdate(BaseModel):
     """Schema for updating a country (all fields optional)"""
     name: Optional[str] = Field(None, min_length=2, max_length=100)
-    code_iso: Optional[str] = Field(None, min_length=2, max_length=3)
+    code_iso: Optional[CountryCode] = None
     currency_id: Optional[UUID] = None
     can_send: Optional[bool] = None
-    
-    @field_validator('code_iso')
-    @classmethod
-    def validate_code_iso(cls, v):
-        if v is not None:
-            return v.upper().strip()
-        return v
 
 
 class CountryModel(CountryBase):
@@ -51,8 +42,7 @@ class CountryModel(CountryBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CountrySimple(BaseModel):
@@ -61,8 +51,7 @@ class CountrySimple(BaseModel):
     name: str
     code_iso: str
    
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CountryList(BaseModel):
@@ -89,6 +78,5 @@ class CountryWithMethods(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
@@ -1,7 +1,7 @@
 from decimal import Decimal
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from datetime import datetime
-from pydantic import BaseModel, field_validator, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from uuid import UUID
 
 
@@ -9,13 +9,11 @@ from uuid import UUID
 # CURRENCY SCHEMAS
 # ============================================
 
+# Stripped and upper-cased by pydantic-core before the length check
+CurrencyCode = Annotated[str, StringConstraints(strip_whitespace=True, to_upper=True, min_length=3, max_length=3)]
+
 class CurrencyBase(BaseModel):
-    code: str = Field(..., min_length=3, max_length=3, description="ISO 4217 currency code (e.g., USD, EUR)")
-    
-    @field_validator('code')
-    @classmethod
-    def validate_code(cls, v):
-        return v.upper().strip()
+    code: CurrencyCode = Field(..., description="ISO 4217 currency code (e.g., USD, EUR)")
 
 
 class CurrencyCreate(CurrencyBase):
@@ -25,16 +23,9 @@ class CurrencyCreate(CurrencyBase):
 
 class CurrencyUpdate(BaseModel):
     """Schema for updating a currency (all fields optional)"""
-    code: Optional[str] = Field(None, min_length=3, max_length=3)
+    code: Optional[CurrencyCode] = None
     name: Optional[str] = None
     symbol: Optional[str] = None
-    
-    @field_validator('code')
-    @classmethod
-    def validate_code(cls, v):
-        if v is not None:
-            return v.upper().strip()
-        return v
 
 
 class CurrencyModel(BaseModel):
@@ -46,8 +37,7 @@ class CurrencyModel(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CurrencyList(BaseModel):
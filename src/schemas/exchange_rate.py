@@ -1,10 +1,12 @@
 from decimal import Decimal
-from typing import Optional
+from typing import Annotated, Optional
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, field_serializer, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, model_validator
 from enum import Enum
 
+from src.schemas.base import AsFloat
+
 
 # Enum pour le type de conversion
 class ConversionType(str, Enum):
@@ -12,32 +14,22 @@ class ConversionType(str, Enum):
     RECEIVE = "receive"  # L'utilisateur spécifie le montant à recevoir
 
 
+# Code de devise nettoyé et mis en majuscules par pydantic-core, jamais vide
+CurrencyCodeParam = Annotated[str, StringConstraints(strip_whitespace=True, to_upper=True, min_length=1)]
+
+
 # Schéma pour la création d'un taux de change
 class CreateExchangeRate(BaseModel):
     from_currency_id: UUID
     to_currency_id: UUID
-    rate: Decimal
-
-    @field_validator('rate')
-    @classmethod
-    def validate_rate(cls, v):
-        if v <= 0:
-            raise ValueError("Le taux de change doit être positif")
-        return v
+    rate: Decimal = Field(..., gt=0)
 
 
 # Schéma pour la mise à jour d'un taux de change
 class UpdateExchangeRate(BaseModel):
     from_currency_id: Optional[UUID] = None
     to_currency_id: Optional[UUID] = None
-    rate: Optional[Decimal] = None
-
-    @field_validator('rate')
-    @classmethod
-    def validate_rate(cls, v):
-        if v is not None and v <= 0:
-            raise ValueError("Le taux de change doit être positif")
-        return v
+    rate: Optional[Decimal] = Field(None, gt=0)
 
 
 # Schéma pour lire un taux de change
@@ -49,8 +41,7 @@ class ExchangeRateRead(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
         
 class ExchangeRateListResponse(BaseModel):
     id: UUID
@@ -71,24 +62,10 @@ class ExchangeRateListResponse(BaseModel):
 
 # Schéma pour la requête de conversion (FLEXIBLE)
 class ConversionRequest(BaseModel):
-    from_currency: str  # Code de la devise source (ex: "USD")
-    to_currency: str    # Code de la devise cible (ex: "EUR")
-    send_amount: Optional[Decimal] = None      # Montant à envoyer
-    receive_amount: Optional[Decimal] = None   # Montant à recevoir
-
-    @field_validator('from_currency', 'to_currency')
-    @classmethod
-    def validate_currency_code(cls, v):
-        if not v or len(v.strip()) == 0:
-            raise ValueError("Le code de devise ne peut pas être vide")
-        return v.upper().strip()
-
-    @field_validator('send_amount', 'receive_amount')
-    @classmethod
-    def validate_amount(cls, v):
-        if v is not None and v <= 0:
-            raise ValueError("Le montant doit être positif")
-        return v
+    from_currency: CurrencyCodeParam  # Code de la devise source (ex: "USD")
+    to_currency: CurrencyCodeParam    # Code de la devise cible (ex: "EUR")
+    send_amount: Optional[Decimal] = Field(None, gt=0)      # Montant à envoyer
+    receive_amount: Optional[Decimal] = Field(None, gt=0)   # Montant à recevoir
 
     @model_validator(mode='after')
     def validate_amounts(self):
@@ -118,15 +95,11 @@ class ConversionQueryParams(BaseModel):
 class ConversionResponse(BaseModel):
     from_currency: str
     to_currency: str
-    send_amount: Decimal       # Montant envoyé
-    receive_amount: Decimal    # Montant reçu
-    exchange_rate: Decimal     # Taux de change utilisé
+    send_amount: Annotated[Decimal, AsFloat]       # Montant envoyé
+    receive_amount: Annotated[Decimal, AsFloat]    # Montant reçu
+    exchange_rate: Annotated[Decimal, AsFloat]     # Taux de change utilisé
     conversion_type: ConversionType  # Type de conversion effectuée
     timestamp: Optional[datetime] = None
-    
-    @field_serializer('send_amount', 'receive_amount', 'exchange_rate')
-    def serialize_decimal(self, value: Decimal) -> float:
-        return float(value)
 
     class Config:
         json_schema_extra = {
@@ -160,26 +133,17 @@ class ConversionError(BaseModel):
 
 # Schéma pour obtenir le taux de change actuel (sans conversion)
 class ExchangeRateQuery(BaseModel):
-    from_currency: str
-    to_currency: str
-
-    @field_validator('from_currency', 'to_currency')
-    @classmethod
-    def validate_currency_code(cls, v):
-        return v.upper().strip()
+    from_currency: CurrencyCodeParam
+    to_currency: CurrencyCodeParam
 
 
 # Schéma pour la réponse du taux de change
 class ExchangeRateResponse(BaseModel):
     from_currency: str
     to_currency: str
-    rate: Decimal
-    inverse_rate: Decimal  # Taux inverse (utile pour l'app Flutter)
+    rate: Annotated[Decimal, AsFloat]
+    inverse_rate: Annotated[Decimal, AsFloat]  # Taux inverse (utile pour l'app Flutter)
     last_updated: Optional[datetime] = None
-    
-    @field_serializer('rate', 'inverse_rate')
-    def serialize_decimal(self, value: Decimal) -> float:
-        return float(value)
 
     class Config:
         json_schema_extra = {
@@ -1,11 +1,9 @@
 import uuid
+from typing import List
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 
-
-class BaseSchema(BaseModel):
-	class Config:
-		from_attributes = True
+from src.schemas.base import BaseSchema
 
 
 class FCMToken(BaseSchema):
@@ -13,4 +11,8 @@ class FCMToken(BaseSchema):
 	token: str
 
 class TokenRequest(BaseSchema):
-	token: str
\ No newline at end of file
+	token: str
+
+
+# Validate and dump a whole batch of rows in one pydantic-core call
+FCM_TOKEN_LIST_ADAPTER = TypeAdapter(List[FCMToken])
\ No newline at end of file
@@ -1,7 +1,7 @@
 from decimal import Decimal
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, field_validator, Field
+from pydantic import BaseModel, ConfigDict, Field
 from uuid import UUID
 
 from src.schemas.country import CountrySimple
@@ -12,15 +12,6 @@ from src.schemas.country import CountrySimple
 
 class FeeBase(BaseModel):
     fee: Decimal = Field(..., gt=0, description="Fee amount (must be positive)")
-    
-    @field_validator('fee')
-    @classmethod
-    def validate_fee(cls, v, info):
-        if v <= 0:
-            raise ValueError("Fee must be positive")
-        # If percentage, ensure it's reasonable (0-100)
-        
-        return v
 
 
 class FeeCreate(FeeBase):
@@ -52,8 +43,7 @@ class FeeView(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FeeWithCountries(FeeView):
@@ -1,8 +1,7 @@
 import uuid
 from typing import Optional
 
-from pydantic import BaseModel, validator
-from pydantic.v1 import root_validator
+from pydantic import BaseModel, model_validator
 
 
 class PaymentTypeBase(BaseModel):
@@ -12,17 +11,14 @@ class PaymentTypeBase(BaseModel):
 	account_number: Optional[str]
 	country_id: uuid.UUID
 
-	@root_validator
-	def require_at_least_one_contact(cls, values):
-		phone = values.get('phone_number')
-		account = values.get('account_number')
-		if not phone and not account:
-			raise ValueError('Phone number or account number must be provided')
-		return values
-
 
 class PaymentTypeCreate(PaymentTypeBase):
-	pass
+	# Input only: rows read back through PaymentTypeRead skip the Python hook
+	@model_validator(mode='after')
+	def require_at_least_one_contact(self):
+		if not self.phone_number and not self.account_number:
+			raise ValueError('Phone number or account number must be provided')
+		return self
 
 
 class PaymentTypeRead(PaymentTypeBase):
@@ -36,14 +32,14 @@ class PaymentTypeUpdate(BaseModel):
 	account_number: Optional[str] = None
 	country_id: Optional[uuid.UUID] = None
 
-	@root_validator
-	def check_at_least_one_field_updated(cls, values):
+	@model_validator(mode='after')
+	def check_at_least_one_field_updated(self):
 		if not any([
-			values.get('type'),
-			values.get('owner_first_name'),
-			values.get('phone_number'),
-			values.get('account_number'),
-			values.get('country_id'),
+			self.type,
+			self.owner_full_name,
+			self.phone_number,
+			self.account_number,
+			self.country_id,
 		]):
 			raise ValueError('At least one field must be updated')
-		return values
\ No newline at end of file
+		return self
\ No newline at end of file
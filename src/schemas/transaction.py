@@ -3,11 +3,12 @@ from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
+from src.schemas.base import AsFloat
 from src.schemas.country import CountryWithMethods
 from src.schemas.payment_method import PaymentTypeRead
 from src.schemas.rtype import ReceivingTypeRead
@@ -18,21 +19,17 @@ from src.schemas.user import UserRead
 class TransactionBase(BaseModel):
     sender_country: str
     sender_currency: str
-    sender_amount: int
+    sender_amount: Annotated[int, AsFloat]
     receiver_country: str
     receiver_currency: str
-    receiver_amount: int
-    conversion_rate: Decimal
+    receiver_amount: Annotated[int, AsFloat]
+    conversion_rate: Annotated[Decimal, AsFloat]
     payment_method: str
     recipient_name: str
     recipient_phone: str
     receiving_method: str
     include_fee: bool
     fee_amount: int
-    
-    @field_serializer('sender_amount', 'receiver_amount', 'conversion_rate')
-    def serialize_decimal(self, value: Decimal) -> float:
-        return float(value)
 
 
 
@@ -102,13 +99,18 @@ class TransferQuoteRequest(BaseModel):
         default=False,
         description="If true, fees are included in the amount. If false, fees are added on top"
     )
-    
-    @field_validator('amount')
-    @classmethod
-    def validate_amount(cls, v):
-        if v <= 0:
-            raise ValueError("Amount must be positive")
-        return v
+
+
+class BreakdownView(BaseModel):
+    """Pre-formatted amounts for display: a fixed shape instead of a free-form dict"""
+    you_send: str = Field(..., examples=["100.00 USD"])
+    fee: str = Field(..., examples=["5.00 USD"])
+    fee_included: bool
+    total_to_pay: str = Field(..., examples=["105.00 USD"])
+    exchange_rate: str = Field(..., examples=["1 USD = 0.92 EUR"])
+    they_receive: str = Field(..., examples=["92.00 EUR"])
+
+    model_config = ConfigDict(frozen=True)
 
 
 class TransferQuoteResponse(BaseModel):
@@ -144,17 +146,7 @@ class TransferQuoteResponse(BaseModel):
     )
     
     # Breakdown for display
-    breakdown: dict = Field(
-        ...,
-        description="Detailed breakdown of calculation",
-        examples=[{
-            "you_send": "100.00 USD",
-            "fee": "5.00 USD",
-            "total_to_pay": "105.00 USD",
-            "exchange_rate": "1 USD = 0.92 EUR",
-            "they_receive": "92.00 EUR"
-        }]
-    )
+    breakdown: BreakdownView = Field(..., description="Detailed breakdown of calculation")
     
     # Additional info
     rate_expires_at: Optional[datetime] = Field(
@@ -233,17 +225,7 @@ class TransferPreviewResponse(BaseModel):
     payment_instructions: PaymentInstructions
 
     # Breakdown for display
-    breakdown: dict = Field(
-        ...,
-        description="Detailed breakdown of calculation",
-        examples=[{
-            "you_send": "100.00 USD",
-            "fee": "5.00 USD",
-            "total_to_pay": "105.00 USD",
-            "exchange_rate": "1 USD = 0.92 EUR",
-            "they_receive": "92.00 EUR"
-        }]
-    )
+    breakdown: BreakdownView = Field(..., description="Detailed breakdown of calculation")
 
 # ============================================
 # TRANSFER LIMITS
@@ -316,21 +298,17 @@ class PaymentInstructions(BaseModel):
 
 
 
+# Statuts qu'un admin peut poser : vérifiés par pydantic-core, sans validateur Python
+AdminAllowedStatus = Literal[
+    TransactionStatus.IN_PROGRESS,
+    TransactionStatus.COMPLETED,
+    TransactionStatus.CANCELLED,
+]
+
+
 class UpdateTransactionStatus(BaseModel):
     """Seules transitions autorisées par l'admin"""
-    status: TransactionStatus
-
-    @field_validator('status')
-    @classmethod
-    def validate_status(cls, v):
-        allowed = {
-            TransactionStatus.IN_PROGRESS,
-            TransactionStatus.COMPLETED,
-            TransactionStatus.CANCELLED,
-        }
-        if v not in allowed:
-            raise ValueError(f"Admin ne peut mettre que: {[s.value for s in allowed]}")
-        return v
+    status: AdminAllowedStatus
     
     
 # ============================================
@@ -349,8 +327,7 @@ class StatusUpdateResponse(BaseModel):
     reference: str
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Transitions valides
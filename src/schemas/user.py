@@ -1,9 +1,9 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Annotated, Optional, List
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, EmailStr, Field, StringConstraints, TypeAdapter
 
 
 class UserRole(str, Enum):
@@ -12,6 +12,10 @@ class UserRole(str, Enum):
     AGENT = 'agent'
 
 
+# Lower-cased on write so the unique btree on users.email serves every lookup as-is
+LowerEmailStr = Annotated[EmailStr, AfterValidator(str.lower)]
+
+
 class UserBase(BaseModel):
     full_name: str
     phone: str
@@ -22,6 +26,7 @@ class UserBase(BaseModel):
 
 
 class UserCreate(UserBase):
+    email: LowerEmailStr
     password: str
 
 
@@ -32,8 +37,23 @@ class UserRead(UserBase):
     updated_at: datetime
 
 
+class UserListItem(BaseModel):
+    """Compact row for admin listings: just what a user table renders"""
+    id: uuid.UUID
+    full_name: str
+    phone: str
+    email: str
+    role: UserRole
+
+
+# Validate and dump a whole batch of rows in one pydantic-core call each
+USER_LIST_ADAPTER = TypeAdapter(List[UserRead])
+USER_LIST_ITEM_ADAPTER = TypeAdapter(List[UserListItem])
+
+
 class UserLogin(BaseModel):
-    credential: str
+    # Email or phone; lower-casing leaves phone numbers untouched
+    credential: Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]
     password: str
 
 
@@ -0,0 +1,50 @@
+"""In-process caches for the reference data read on every quote.
+
+Entries are plain immutable values, never ORM objects: they outlive the
+session that loaded them and are shared by concurrent requests. Writers
+call the matching invalidator after committing; the TTL bounds staleness
+on the other workers.
+"""
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+
+from cachetools import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class FeeSnapshot:
+    id: uuid.UUID
+    fee: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class RateSnapshot:
+    id: uuid.UUID
+    from_currency_id: uuid.UUID
+    to_currency_id: uuid.UUID
+    rate: Decimal
+
+
+# Keyed by (from_country_id, to_country_id); misses are cached too, as MISSING
+fee_by_route: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+# Keyed by (from_currency_id, to_currency_id); only hits are kept
+rate_by_pair: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+# Currency code -> id for the conversion endpoints; only hits are kept
+currency_id_by_code: TTLCache = TTLCache(maxsize=512, ttl=60)
+
+MISSING = object()
+
+
+def invalidate_fee_cache() -> None:
+    fee_by_route.clear()
+
+
+def invalidate_exchange_rate_cache() -> None:
+    rate_by_pair.clear()
+
+
+def invalidate_currency_cache() -> None:
+    currency_id_by_code.clear()